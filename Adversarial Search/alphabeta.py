@@ -1,113 +1,126 @@
 import math
+import os
+import sys
 
-# Initialize a 3x3 Tic-Tac-Toe board with empty spaces.
-board = [
-    [' ', ' ', ' '],
-    [' ', ' ', ' '],
-    [' ', ' ', ' ']
-]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tictactoe.bitboard import CELLS, FULL, OPEN_LINES, WINS, Board
+from tictactoe.ordering import MoveOrdering
+from tictactoe.transposition import (EXACT, LOWER, UPPER, TranspositionTable, canonical_symmetry,
+                                     from_canonical, to_canonical)
+
+# Initialize an empty 3x3 Tic-Tac-Toe board: one 9-bit mask per player,
+# bit 3 * row + col (see tictactoe/bitboard.py).
+board = Board()
 nodes_visited = 0  # Counter for the number of nodes visited
+table = TranspositionTable()  # Positions already searched, shared by every orientation
+# Which cells to try first. The history heuristic is left off: on a board this
+# small it visits more nodes than it saves (benchmarks/move_ordering.py)
+ordering = MoveOrdering(history=False)
 
 def print_board():
     """Prints the current state of the board."""
-    for row in board:
+    for row in board.rows():
         print('|'.join(row))
     print("\n")
 
 def is_winner(player):
     """Checks if the given player has won."""
-    #checking each row
-    for row in board:
-        if all(s == player for s in row):
-            return True
-    #checking each column
-    for col in range(3):
-        if all(board[row][col] == player for row in range(3)):
-            return True
-    #checking both diagonals
-    if all(board[i][i] == player for i in range(3)) or all(board[i][2-i] == player for i in range(3)):
-        return True
-    return False
+    return bool(WINS[board.mask(player)])
 
 def is_full():
     """Returns True if the board is full."""
-    return all(cell != ' ' for row in board for cell in row)
+    return board.x | board.o == FULL
 
 def count_winning_lines(player):
     """Counts the total possible winning lines for a player."""
-    lines = 0
-    #checking winning lines in rows
-    for row in board:
-        if all(s == player or s == ' ' for s in row):
-            lines += 1
-    #checking winning lines in columns
-    for col in range(3):
-        if all(board[row][col] == player or board[row][col] == ' ' for row in range(3)):
-            lines += 1
-    #checking winning lines in diagnols
-    if all(board[i][i] == player or board[i][i] == ' ' for i in range(3)):
-        lines += 1
-    if all(board[i][2-i] == player or board[i][2-i] == ' ' for i in range(3)):
-        lines += 1
-    return lines
+    # A line is still winnable when the opponent has no mark on it
+    return OPEN_LINES[board.o if player == 'X' else board.x]
 
 def heuristic():
     """Evaluates the board state using E(n) = M(n) - O(n)."""
-    return count_winning_lines('O') - count_winning_lines('X')
+    return OPEN_LINES[board.x] - OPEN_LINES[board.o]
 
 def minimax(depth, is_maximizing, alpha, beta):
-    """Minimax algorithm with Alpha-Beta pruning and node counting."""
+    """Minimax algorithm with Alpha-Beta pruning, move ordering, a transposition table and node counting."""
     global nodes_visited
     nodes_visited += 1  # Increment the counter at each node visit
 
-    if is_winner('X'):  # if player wins
+    x, o = board.x, board.o
+    if WINS[x]:  # if player wins
         return -10 + depth
-    if is_winner('O'):  # if AI wins
+    if WINS[o]:  # if AI wins
         return 10 - depth
-    if is_full():
+    taken = x | o
+    if taken == FULL:
         return 0
 
+    # Win scores depend on the depth, so it is part of the key
+    key, symmetry = canonical_symmetry(x, o)
+    key = key << 4 | depth
+    entry = table.probe(key)
+    hash_move = None
+    if entry is not None:
+        flag, value, move = entry
+        if flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha):
+            return value
+        if move is not None:
+            hash_move = from_canonical(move, symmetry)
+
+    # This node's heuristic is added to its best child's score, so the
+    # children are searched with the window shifted by it
+    h = OPEN_LINES[x] - OPEN_LINES[o]
+    child_alpha, child_beta = alpha - h, beta - h
+    draft = (FULL ^ taken).bit_count()
+    best_pos = None
     if is_maximizing:  # AI's turn (maximize score)
         max_eval = -math.inf
-        for i in range(3):
-            for j in range(3):
-                if board[i][j] == ' ':
-                    board[i][j] = 'O'
-                    eval = minimax(depth + 1, False, alpha, beta)
-                    board[i][j] = ' '
-                    max_eval = max(max_eval, eval)
-                    alpha = max(alpha, eval)
-                    if beta <= alpha:
-                        break
-        return max_eval + heuristic()
+        for pos in ordering.moves(taken, depth, True, hash_move):
+            board.o = o | CELLS[pos]
+            eval = minimax(depth + 1, False, child_alpha, child_beta)
+            board.o = o
+            if eval > max_eval:
+                max_eval, best_pos = eval, pos
+            child_alpha = max(child_alpha, eval)
+            if child_beta <= child_alpha:
+                ordering.cutoff(pos, depth, True, draft)
+                break
+        value = max_eval + h
     else:               # Player's turn (minimize score)
         min_eval = math.inf
-        for i in range(3):
-            for j in range(3):
-                if board[i][j] == ' ':
-                    board[i][j] = 'X'
-                    eval = minimax(depth + 1, True, alpha, beta)
-                    board[i][j] = ' '
-                    min_eval = min(min_eval, eval)
-                    beta = min(beta, eval)
-                    if beta <= alpha:
-                        break
-        return min_eval + heuristic()
+        for pos in ordering.moves(taken, depth, False, hash_move):
+            board.x = x | CELLS[pos]
+            eval = minimax(depth + 1, True, child_alpha, child_beta)
+            board.x = x
+            if eval < min_eval:
+                min_eval, best_pos = eval, pos
+            child_beta = min(child_beta, eval)
+            if child_beta <= child_alpha:
+                ordering.cutoff(pos, depth, False, draft)
+                break
+        value = min_eval + h
+
+    flag = UPPER if value <= alpha else LOWER if value >= beta else EXACT
+    table.store(key, draft, flag, value, to_canonical(best_pos, symmetry))
+    return value
 
 def best_move():
     """Finds and executes the best move for AI."""
     best_score = -math.inf
-    move = (-1, -1)
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == ' ':
-                board[i][j] = 'O'
-                score = minimax(0, False, -math.inf, math.inf)
-                board[i][j] = ' '
-                if score > best_score:
-                    best_score = score
-                    move = (i, j)
-    board[move[0]][move[1]] = 'O'
+    move = -1
+    o = board.o
+    table.new_search()
+    ordering.new_search()
+    # Every root move gets the full window, so the scores are exact whatever
+    # the order below; board order here keeps ties going to the same cell
+    for pos, bit in enumerate(CELLS):
+        if not (board.x | o) & bit:
+            board.o = o | bit
+            score = minimax(0, False, -math.inf, math.inf)
+            board.o = o
+            if score > best_score:
+                best_score = score
+                move = pos
+    board.o = o | CELLS[move]
 
 def main():
     """Main game loop with single number input."""
@@ -115,11 +128,10 @@ def main():
     while True:
         print_board()
         pos = int(input("Enter position (0-8): "))
-        row, col = divmod(pos, 3)
-        if board[row][col] != ' ':
+        if board.cell(pos) != ' ':
             print("Invalid move! Try again.")
             continue
-        board[row][col] = 'X'
+        board.place(pos, 'X')
         if is_winner('X'):
             print_board()
             print("You win!")
@@ -137,7 +149,8 @@ def main():
             print_board()
             print("It's a tie!")
             break
-    print(f"Total nodes visited: {nodes_visited}")
+    print(f"Total nodes visited: {nodes_visited} "
+          f"(transposition table: {table.hits} hits, {table.misses} misses)")
 
 if __name__ == "__main__":
     main()
@@ -1,97 +1,96 @@
 # Write your code here :-)
 import math
+import os
+import sys
 
-# Initialize a 3x3 Tic-Tac-Toe board with empty spaces.
-board = [
-    [' ', ' ', ' '],
-    [' ', ' ', ' '],
-    [' ', ' ', ' ']
-]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tictactoe.bitboard import CELLS, FULL, OPEN_LINES, WINS, Board
+from tictactoe.book import load_book
+from tictactoe.transposition import EXACT, TranspositionTable, canonical
+
+# Initialize an empty 3x3 Tic-Tac-Toe board: one 9-bit mask per player,
+# bit 3 * row + col (see tictactoe/bitboard.py).
+board = Board()
 nodes_visited = 0  # Counter for the number of nodes visited
+table = TranspositionTable()  # Positions already searched, shared by every orientation
+book = load_book()  # Precomputed moves (python -m tictactoe.book build); None searches live
 
 def print_board():
     """Prints the current state of the board."""
-    for row in board:
+    for row in board.rows():
         print('|'.join(row))
     print("\n")
 
 def is_winner(player):
     """Checks if the given player has won."""
-    #checking each row
-    for row in board:   
-        if all(s == player for s in row):
-            return True
-    #checking each column
-    for col in range(3): 
-        if all(board[row][col] == player for row in range(3)):
-            return True
-    #checking both diagnols
-    if all(board[i][i] == player for i in range(3)) or all(board[i][2-i] == player for i in range(3)): 
-        return True
-    return False
+    return bool(WINS[board.mask(player)])
 
 def is_full():
     """Returns True if the board is full."""
-    return all(cell != ' ' for row in board for cell in row)
+    return board.x | board.o == FULL
 
 def count_winning_lines(player):
     """Counts the total possible winning lines for a player."""
-    lines = 0
-    #checking winning lines in rows
-    for row in board:
-        if all(s == player or s == ' ' for s in row):
-            lines += 1
-    #checking winning lines in columns
-    for col in range(3):
-        if all(board[row][col] == player or board[row][col] == ' ' for row in range(3)):
-            lines += 1
-    #checking winning lines in diagnols
-    if all(board[i][i] == player or board[i][i] == ' ' for i in range(3)):
-        lines += 1
-    if all(board[i][2-i] == player or board[i][2-i] == ' ' for i in range(3)):
-        lines += 1
-    return lines
+    # A line is still winnable when the opponent has no mark on it
+    return OPEN_LINES[board.o if player == 'X' else board.x]
 
 def heuristic():
     """Evaluates the board state using E(n) = M(n) - O(n)."""
-    return count_winning_lines('O') - count_winning_lines('X')
+    return OPEN_LINES[board.x] - OPEN_LINES[board.o]
 
 def minimax(is_maximizing):
-    """Minimax algorithm with heuristic evaluation and node counting."""
+    """Minimax algorithm with heuristic evaluation, a transposition table and node counting."""
     global nodes_visited
     nodes_visited += 1  # Increment the counter at each node visit
 
-    if is_winner('X'):  # if player wins
+    x, o = board.x, board.o
+    if WINS[x]:  # if player wins
         return -10
-    if is_winner('O'):  # if AI wins
+    if WINS[o]:  # if AI wins
         return 10
-    if is_full():
+    taken = x | o
+    if taken == FULL:
         return 0
 
+    # Scores depend only on the position, so any earlier result is exact
+    key = canonical(x, o)
+    entry = table.probe(key)
+    if entry is not None:
+        return entry[1]
+
     best_score = -math.inf if is_maximizing else math.inf
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == ' ':
-                board[i][j] = 'O' if is_maximizing else 'X'
-                score = minimax(not is_maximizing) + heuristic()
-                board[i][j] = ' '
-                best_score = max(best_score, score) if is_maximizing else min(best_score, score)
+    for bit in CELLS:
+        if not taken & bit:
+            # Make the move, search it, then restore the masks
+            if is_maximizing:
+                board.o = o | bit
+            else:
+                board.x = x | bit
+            score = minimax(not is_maximizing) + OPEN_LINES[board.x] - OPEN_LINES[board.o]
+            board.x, board.o = x, o
+            best_score = max(best_score, score) if is_maximizing else min(best_score, score)
+    table.store(key, (FULL ^ taken).bit_count(), EXACT, best_score)
     return best_score
 
 def best_move():
     """Finds and executes the best move for AI."""
+    entry = book.lookup(board.x, board.o) if book is not None else None
+    if entry is not None:
+        board.o |= CELLS[entry[0]]
+        return
     best_score = -math.inf
-    move = (-1, -1)
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == ' ':
-                board[i][j] = 'O'
-                score = minimax(False)
-                board[i][j] = ' '
-                if score > best_score:
-                    best_score = score
-                    move = (i, j)
-    board[move[0]][move[1]] = 'O'
+    move = -1
+    o = board.o
+    table.new_search()
+    for pos, bit in enumerate(CELLS):
+        if not (board.x | o) & bit:
+            board.o = o | bit
+            score = minimax(False)
+            board.o = o
+            if score > best_score:
+                best_score = score
+                move = pos
+    board.o = o | CELLS[move]
 
 def main():
     """Main game loop with single number input."""
@@ -99,11 +98,10 @@ def main():
     while True:
         print_board()
         pos = int(input("Enter position (0-8): "))
-        row, col = divmod(pos, 3)
-        if board[row][col] != ' ':
+        if board.cell(pos) != ' ':
             print("Invalid move! Try again.")
             continue
-        board[row][col] = 'X'
+        board.place(pos, 'X')
         if is_winner('X'):
             print_board()
             print("You win!")
@@ -121,7 +119,8 @@ def main():
             print_board()
             print("It's a tie!")
             break
-    print(f"Total nodes visited: {nodes_visited}")
+    print(f"Total nodes visited: {nodes_visited} "
+          f"(transposition table: {table.hits} hits, {table.misses} misses)")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,58 @@
+"""Play an m,n,k-game (tic-tac-toe on any board, any win length) against the AI.
+
+    python "Adversarial Search/mnk_game.py" --rows 4 --cols 4 --k 4
+    python "Adversarial Search/mnk_game.py" --rows 15 --cols 15 --k 5 --budget 2
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tictactoe.mnk import MNKBoard, Search
+
+def print_board(board):
+    """Prints the current state of the board."""
+    for row in board.rows_of_cells():
+        print('|'.join(row))
+    print("\n")
+
+def main(argv=None):
+    """Main game loop with single number input."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=3)
+    parser.add_argument("--cols", type=int, default=3)
+    parser.add_argument("--k", type=int, default=3, help="marks in a line needed to win")
+    parser.add_argument("--budget", type=float, default=1.0, help="seconds the AI may think per move")
+    parser.add_argument("--max-depth", type=int, help="deepest iteration (default: no limit)")
+    args = parser.parse_args(argv)
+
+    board = MNKBoard(args.rows, args.cols, args.k)
+    search = Search(board, args.budget, args.max_depth)
+    while True:
+        print_board(board)
+        pos = int(input(f"Enter position (0-{board.size - 1}): "))
+        if not 0 <= pos < board.size or board.cell(pos) != ' ':
+            print("Invalid move! Try again.")
+            continue
+        if board.place(pos, 'X'):
+            print_board(board)
+            print("You win!")
+            break
+        if board.is_full():
+            print_board(board)
+            print("It's a tie!")
+            break
+        move = search.best_move('O')
+        print(f"AI plays {move} (searched {search.depth_reached} plies deep)")
+        if board.place(move, 'O'):
+            print_board(board)
+            print("AI wins!")
+            break
+        if board.is_full():
+            print_board(board)
+            print("It's a tie!")
+            break
+    print(f"Total nodes visited: {search.nodes_visited}")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,29 @@
+import math
+import os
+import sys
+from collections import deque
+
+# Make the shared sliding_puzzle package importable from either copy of this lab
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if not os.path.isdir(os.path.join(_HERE, "sliding_puzzle")):
+    sys.path.insert(0, os.path.dirname(_HERE))
+
+from sliding_puzzle import Board
+from sliding_puzzle.distance_table import WIDTH as TABLE_WIDTH, shared_table
+from sliding_puzzle.heuristics import manhattan, manhattan_table
+from sliding_puzzle.node_pool import NodePool
+from sliding_puzzle.stats import SearchStats
+
+BLANK = ' '
+
 class Node:
-    def __init__(self, state, parent=None):
+    __slots__ = ("state", "parent", "blank")
+
+    def __init__(self, state, parent=None, blank=None):
         # Store the node state and parent state
         self.state = state
         self.parent = parent
+        self.blank = blank  # Cell of the empty space when state is packed
 
     def __str__(self):
         # Implement a method to print the state of the node
@@ -15,26 +36,31 @@ class Node:
         return self.__str__()
 
 class PuzzleSolver:
-    def __init__(self, start, goal):
+    def __init__(self, start, goal, on_expand=None, on_generate=None):
         # Initialize the puzzle with start and goal state
         self.start = start
         self.goal = goal
+        # Optional hooks called with (packed state, depth) for every expanded /
+        # generated node; self.stats holds the SearchStats of the last solve
+        self.on_expand = on_expand
+        self.on_generate = on_generate
+        self.stats = None
         self.visited = set()  # Track visited states for backtracking
+        # The searches run on packed int states (see sliding_puzzle.Board)
+        self.board = Board(len(start.state))
+        self.start_key, self.start_blank = self.board.pack(start.state, BLANK)
+        self.goal_key, self.goal_blank = self.board.pack(goal.state, BLANK)
+        # Parity pre-check: every solver returns at once when the goal is unreachable
+        self.solvable = self.board.solvable(self.start_key, self.goal_key)
+        # dist[tile][pos] tables for IDA* (Manhattan) and DFID (all zero)
+        self.manhattan_table = manhattan_table(self.board, self.goal_key)
+        self.zero_table = [[0] * self.board.size] * self.board.size
 
     def is_solvable (self, state):
-        # Check if the puzzle state is solvable
-        array = []
-        for row in state:
-            for tile in row:
-                if tile != ' ':
-                    array.append(tile)
-
-        inversion_count = 0
-        for i in range(len(array)):
-            for j in range(i+1,len(array)):
-                if array[i] and array[j] and array[i] > array[j]:
-                    inversion_count+=1
-        return inversion_count % 2 == 0
+        # Check if the puzzle state can reach the goal (any goal, any width):
+        # O(n) permutation parity against the blank's distance to its goal cell
+        key, _ = self.board.pack(state, BLANK)
+        return self.board.solvable(key, self.goal_key)
 
     def find_space(self, state):
         # Implement the method to find the position (x, y) of the empty space (' ')
@@ -58,11 +84,7 @@ class PuzzleSolver:
         # Implement the method to generate a new state after making the move
         space_x , space_y = space
         move_x , move_y = move
-        new_state = copy.deepcopy(state)
-        for row in range(len(state)):
-            for tiles in range (len(state[0])):
-                new_state[row][tiles] = state[row][tiles]
-        #print(new_state)
+        new_state = [row[:] for row in state]
         new_state[space_x][space_y], new_state[move_x][move_y] = new_state[move_x][move_y], new_state[space_x][space_y]
         return new_state
 
@@ -80,104 +102,321 @@ class PuzzleSolver:
 
     def solve_puzzle_backtracking(self):
         # Implement the search strategy for simple backtracking
+        print("Solving with Backtracking...")
+        self.new_stats("backtracking")
+        return self.report_path(self.backtrack())
 
-        def backtrack(node):
-
-            def backtrack(state, path):
-                if state == self.goal.state:
-                    return path
-
-                self.visited.add(str(state))  # Mark state as visited
-
-                for child in self.generate_children(state):
-                    if str(child) not in self.visited:
-                        result = backtrack(child, path + [child])
-                        if result:
-                            return result
-
-                return None  # No solution found
+    def backtrack(self):
+        # Depth-first backtracking without recursion: the stack holds an
+        # iterator over the untried moves of each depth, and the one packed
+        # state is changed in place on the way down (make) and restored on
+        # the way back up (unmake), so nothing is copied and deep branches
+        # cannot hit the recursion limit. States are never revisited once
+        # seen; returns the packed solution states or None.
+        if not self.solvable:
+            return None
+        stats = self.stats
+        on_expand, on_generate = self.on_expand, self.on_generate
+        board = self.board
+        moves, shifts, mask = board.moves, board.shifts, board.mask
+        goal = self.goal_key
+        state, blank = self.start_key, self.start_blank
+        self.visited = visited = {state}  # Mark state as visited
+        if state == goal:
+            return [state]
+        stack = [iter(moves[blank])]  # Untried moves at each depth
+        cells = [blank]               # Blank cell at each depth
+        undo = []                     # Step added by each move taken
+        expanded, generated, deepest = 1, 0, 0
+        if on_expand:
+            on_expand(state, 0)
+        while True:
+            for target, delta in stack[-1]:
+                child = state + ((state >> shifts[target]) & mask) * delta
+                generated += 1
+                if on_generate:
+                    on_generate(child, len(cells))
+                if child in visited:
+                    continue
+                visited.add(child)
+                if child == goal:
+                    stats.expanded += expanded
+                    stats.generated += generated
+                    stats.frontier(max(deepest, len(cells) + 1))
+                    return board.replay(self.start_key, self.start_blank, cells[1:] + [target])
+                # Make the move and descend
+                undo.append(child - state)
+                state = child
+                cells.append(target)
+                stack.append(iter(moves[target]))
+                expanded += 1
+                if on_expand:
+                    on_expand(state, len(undo))
+                break
+            else:
+                # Every move tried: unmake the one that led here
+                if len(cells) > deepest:
+                    deepest = len(cells)
+                if not undo:
+                    break
+                stack.pop()
+                cells.pop()
+                state -= undo.pop()
+        stats.expanded += expanded
+        stats.generated += generated
+        stats.frontier(deepest)
+        return None
 
-            print("Solving with Backtracking...")
-            path = backtrack(self.start.state, [self.start.state])
+    def graph_search(self, lifo):
+        # Shared BFS/DFS engine: hashed visited set, O(1) deque frontier and
+        # duplicate detection when a child is generated instead of when it is expanded.
+        # Search nodes are NodePool indices; returns the packed solution states.
+        stats = self.new_stats("dfs" if lifo else "bfs")
+        on_expand, on_generate = self.on_expand, self.on_generate
+        if not self.solvable:
+            return None
+        pool = NodePool(self.board)
+        root = pool.add(self.start_key, -1, 0, 0, self.start_blank)
+        if self.is_goal(self.start_key):
+            return pool.path(root)
+        open_list = deque([root])
+        pop = open_list.pop if lifo else open_list.popleft
+        closed_list = {self.start_key}  # Every state ever put on the frontier
+        while open_list:
+            node = pop()
+            stats.expanded += 1
+            if on_expand:
+                on_expand(pool.states[node], pool.g[node])
+            depth = pool.g[node] + 1
+            for child, blank in self.board.children(pool.states[node], pool.blanks[node]):
+                stats.generated += 1
+                if on_generate:
+                    on_generate(child, depth)
+                if child not in closed_list:
+                    closed_list.add(child)
+                    child_node = pool.add(child, node, depth, 0, blank)
+                    if self.is_goal(child):
+                        stats.peak_closed = len(closed_list)
+                        return pool.path(child_node)
+                    open_list.append(child_node)
+            stats.frontier(len(open_list))
+        stats.peak_closed = len(closed_list)
+        return None
 
-            if path:
-                self.disp_solution(path)
-            else:
-                print("No solution found using Backtracking!")
+    def new_stats(self, algorithm):
+        # Start the SearchStats of a new run; report_path stops its clock
+        self.stats = SearchStats(algorithm, self.on_expand, self.on_generate)
+        return self.stats
 
     def solve_puzzle_dfs(self):
         # Implement the search strategy for simple depth-first-search
         print("Solving with DFS...")
-        open_list = [self.start]    # Stack (LIFO) containing the start node
-        closed_list = []            # List to store visited states
-        while open_list:
-            node = open_list.pop()
-            if self.is_goal(node.state):
-                print("Goal state reached!")
-                self.disp_solution(node)   # for displaying all the states that are encountered between
-                return node
-            elif node.state not in closed_list:
-                closed_list.append(node.state)
-                childs = self.generate_children(node.state)
-                for child in childs:
-                        if child not in closed_list:
-                            open_list.append(Node(child,node))
-        print("No solution found!")
+        states = self.graph_search(lifo=True)    # Stack (LIFO) frontier
+        if states:
+            print("Goal state reached!")
+        return self.report_path(states)   # for displaying all the states that are encountered between
 
     def solve_puzzle_bfs(self):
         # Implement the search strategy for breadth-first-search
         print("Solving with BFS...")
-        open_list = [self.start]     # Queue (FIFO) containing the start node
-        #print(open_list)
-        closed_list = []             # List to store visited states
+        states = self.graph_search(lifo=False)   # Queue (FIFO) frontier
+        if states:
+            print("Goal state reached!")
+        return self.report_path(states) #for displaying all the states that are encountered between
 
-        while open_list:
-            node = open_list.pop(0)  # Remove the first added node (FIFO behavior)
-            if self.is_goal(node.state):
-                print("Goal state reached!")
-                self.disp_solution(node) #for displaying all the states that are encountered between
-                return node
-            elif node.state not in closed_list:
-                closed_list.append(node.state)
-                childs = self.generate_children(node.state)
-                for child in childs :
-                    if child not in closed_list:
-                        open_list.append(Node(child, node))
-
-        print("No solution found!")
-        return None
+    def solve_puzzle_bidirectional(self):
+        # Bidirectional BFS: grow one whole layer at a time from whichever side
+        # has the smaller frontier, and stop as soon as a generated child is
+        # already known to the other side. Each side only reaches about half
+        # the solution depth, so far fewer states are stored.
+        print("Solving with Bidirectional BFS...")
+        stats = self.new_stats("bidirectional")
+        on_expand, on_generate = self.on_expand, self.on_generate
+        if not self.solvable:
+            return self.report_path(None)
+        if self.start_key == self.goal_key:
+            return self.report_path([self.start_key])
+        parents = [{self.start_key: None}, {self.goal_key: None}]
+        frontiers = [[(self.start_key, self.start_blank)], [(self.goal_key, self.goal_blank)]]
+        depths = [0, 0]
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            mine, other = parents[side], parents[1 - side]
+            depths[side] += 1
+            next_layer = []
+            for state, blank in frontiers[side]:
+                stats.expanded += 1
+                if on_expand:
+                    on_expand(state, depths[side] - 1)
+                for child, child_blank in self.board.children(state, blank):
+                    stats.generated += 1
+                    if on_generate:
+                        on_generate(child, depths[side])
+                    if child in mine:
+                        continue
+                    mine[child] = state
+                    if child in other:
+                        stats.peak_closed = len(mine) + len(other)
+                        return self.report_path(self.splice(child, parents[0], parents[1]))
+                    next_layer.append((child, child_blank))
+            frontiers[side] = next_layer
+            stats.frontier(len(frontiers[0]) + len(frontiers[1]))
+        stats.peak_closed = len(parents[0]) + len(parents[1])
+        return self.report_path(None)
+
+    def splice(self, meet, forward, backward):
+        # Join the start->meet and meet->goal halves of a bidirectional search
+        states = []
+        state = meet
+        while state is not None:
+            states.append(state)
+            state = forward[state]
+        states.reverse()
+        state = backward[meet]
+        while state is not None:
+            states.append(state)
+            state = backward[state]
+        return states
 
     def solve_puzzle_dfid(self):
         # Implement the search strategy for depth-first-search with iterative deepening
         print("Solving with DFID...")
-        def dls(node, depth):
-            if node.state == self.goal.state:
-                self.disp_solution(node)
-                return node
-            if depth == 0:
-                return None
+        # DFID is the IDA* loop with h = 0, so the bound grows one level at a time
+        self.new_stats("dfid")
+        path = self.iterative_deepening(self.zero_table)
+        return self.report_path(path)
+
+    def solve_puzzle_ida_star(self):
+        # IDA*: iterative deepening on f = g + h with the Manhattan distance to the goal
+        print("Solving with IDA*...")
+        self.new_stats("ida_star")
+        path = self.iterative_deepening(self.manhattan_table)
+        return self.report_path(path)
 
-            for child_state in self.generate_children(node.state):
-                child = Node(child_state, node)
-                res = dls(child, depth - 1)
-                if res:
-                    return res
+    def solve_puzzle_lookup(self):
+        # Optimal 8-puzzle path read off the precomputed distance table (no search);
+        # other widths, and goals the table cannot be relabelled to, fall back to IDA*
+        if self.board.width != TABLE_WIDTH or not self.solvable:
+            return self.solve_puzzle_ida_star()
+        try:
+            moves = shared_table().moves(self.start_key, self.start_blank, self.goal_key)
+        except ValueError:
+            return self.solve_puzzle_ida_star()
+        print("Solving with the distance table...")
+        stats = self.new_stats("lookup")
+        if moves is None:
+            return self.report_path(None)
+        stats.expanded = len(moves)  # One table probe per step
+        return self.report_path(self.board.replay(self.start_key, self.start_blank, moves))
+
+    def iterative_deepening(self, dist):
+        # Depth-first search bounded by f = g + h, where h is summed from the
+        # dist[tile][pos] table and updated per move. Never slides the blank
+        # straight back to where it came from. Runs without recursion: the
+        # stack holds an iterator over the untried moves of each depth, and
+        # the one packed state is changed in place on the way down (make)
+        # and restored on the way back up (unmake), so memory is O(depth).
+        # Counts into self.stats, where the peak frontier is the deepest path held.
+        if not self.solvable:
             return None
+        stats = self.stats
+        on_expand, on_generate = self.on_expand, self.on_generate
+        board = self.board
+        moves, shifts, mask = board.moves, board.shifts, board.mask
+        goal = self.goal_key
+        start, start_blank = self.start_key, self.start_blank
+        if start == goal:
+            return [start]
 
-        # Call dls function iteratively and search
-        depth = 0
+        h = manhattan(board, dist, start)
+        bound = h
         while True:
-            res = dls(self.start, depth)
-            if res:
-                return res
-            depth += 1
+            state, blank, prev, g = start, start_blank, None, 0
+            stack = [iter(moves[blank])]  # Untried moves at each depth
+            cells = [blank]               # Blank cell at each depth
+            undo = []                     # (step, h change) of each move taken
+            minimum = math.inf
+            expanded, generated, deepest = 1, 0, 0
+            if on_expand:
+                on_expand(state, 0)
+            while True:
+                for target, delta in stack[-1]:
+                    if target == prev:
+                        continue  # Would undo the previous move
+                    tile = (state >> shifts[target]) & mask
+                    dh = dist[tile][blank] - dist[tile][target]
+                    step = tile * delta
+                    generated += 1
+                    if on_generate:
+                        on_generate(state + step, g + 1)
+                    if g + 1 + h + dh > bound:
+                        if g + 1 + h + dh < minimum:
+                            minimum = g + 1 + h + dh
+                        continue
+                    # Make the move and descend
+                    state += step
+                    if state == goal:
+                        stats.expanded += expanded
+                        stats.generated += generated
+                        stats.frontier(max(deepest, g + 2))
+                        return board.replay(start, start_blank, cells[1:] + [target])
+                    h += dh
+                    g += 1
+                    undo.append((step, dh))
+                    cells.append(target)
+                    prev, blank = blank, target
+                    stack.append(iter(moves[blank]))
+                    expanded += 1
+                    if on_expand:
+                        on_expand(state, g)
+                    break
+                else:
+                    # Every move tried: unmake the one that led here
+                    if g >= deepest:
+                        deepest = g + 1
+                    if not g:
+                        break
+                    stack.pop()
+                    step, dh = undo.pop()
+                    state -= step
+                    h -= dh
+                    g -= 1
+                    cells.pop()
+                    blank, prev = prev, cells[-2] if g else None
+            stats.expanded += expanded
+            stats.generated += generated
+            stats.frontier(deepest)
+            if minimum == math.inf:
+                return None
+            bound = minimum
+
+    def report_path(self, states):
+        # Display a list of packed states found by a search, with the run's
+        # statistics, and return its last Node
+        self.stats.finish(states)
+        if states is None:
+            print("No solution found!" if self.solvable else "Puzzle is not solvable!")
+            print(self.stats)
+            return None
+        node = self.unpack_states(states)
+        self.disp_solution(node)
+        print(self.stats)
+        return node
+
+    def unpack_states(self, states):
+        # Turn a start-to-goal list of packed states into a chain of grid Nodes
+        path = None
+        for state in states:
+            path = Node(self.board.unpack(state, BLANK), path)
+        return path
 
     def disp_solution(self, final_state):
         # Implement the method to display the solution path
         path_states = []
         while final_state:
-            path_states.insert(0, final_state)
+            path_states.append(final_state)
             final_state = final_state.parent
+        path_states.reverse()
         print("\nSolution Path:")
         i=1
         for step in path_states:
@@ -186,7 +425,7 @@ class PuzzleSolver:
             i+=1
 
     def is_goal(self, current_state):
-      return current_state == self.goal.state
+      return current_state == self.goal_key
 
 #Run this Test-Case
 
@@ -214,8 +453,12 @@ def main ():
     if solver.is_solvable(start.state):
         #print(solver.solve_puzzle_dfs())
         #print(solver.solve_puzzle_bfs())
+        #print(solver.solve_puzzle_bidirectional())
         print(solver.solve_puzzle_dfid())
+        #print(solver.solve_puzzle_ida_star())
+        #print(solver.solve_puzzle_lookup())
         #print(solver.solve_puzzle_backtracking())
     else:
       print("Puzzle is not solveable")
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Check that ARA* ends on an optimal path and never claims a wrong bound.
+
+    python benchmarks/anytime.py [--heuristics manhattan,linear_conflict]
+
+Runs ``solve_puzzle_anytime`` to completion on every 8-puzzle in the corpus
+plus the regression starts below, and checks that each yielded bound holds
+against the optimal length (from the corpus, or from A*) and that the last
+path is optimal with bound 1. Heuristics that are not consistent must be
+rejected. The exit status is 1 when any check fails.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from corpus import CORPUS, load
+from sliding_puzzle.informed import PuzzleSolver
+
+# Starts that once ended with a suboptimal path reported as optimal
+REGRESSIONS = [
+    [[5, 6, 3], [7, 4, 1], [0, 8, 2]],  # pdb: 24 moves with bound 1.0, optimum 22
+]
+
+
+def check(start, heuristic, optimal):
+    """ Problems found running ARA* on ``start``; an empty list when it is fine. """
+    solver = PuzzleSolver(start, heuristic)
+    try:
+        results = [(len(path) - 1, bound) for path, bound in solver.solve_puzzle_anytime()]
+    except ValueError:
+        if solver.heuristic.consistent:
+            raise
+        return []  # Rejected, as it should be
+    if not solver.heuristic.consistent:
+        return [f"{heuristic}: inconsistent heuristic was not rejected"]
+    problems = [f"{heuristic}: {length} moves claimed within {bound} of {optimal}"
+                for length, bound in results if length > bound * optimal]
+    if not results or results[-1] != (optimal, 1.0):
+        problems.append(f"{heuristic}: ended with {results[-1] if results else None}, optimum {optimal}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", default=CORPUS)
+    parser.add_argument("--heuristics", default="manhattan,linear_conflict,walking_distance,pdb")
+    args = parser.parse_args()
+
+    starts = [(instance["id"], instance["start"], instance["depth"])
+              for instance in load(args.corpus) if instance["width"] == 3]
+    starts += [(f"regression-{i}", start, len(PuzzleSolver(start).solve_puzzle()) - 1)
+               for i, start in enumerate(REGRESSIONS)]
+    failures = 0
+    for name, start, optimal in starts:
+        for heuristic in args.heuristics.split(","):
+            for problem in check(start, heuristic, optimal):
+                print(f"{name} {problem}")
+                failures += 1
+    print(f"{len(starts)} starts, {failures} problems")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
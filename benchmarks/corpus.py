@@ -0,0 +1,106 @@
+"""Build the benchmark corpus: 8- and 15-puzzle instances stratified by optimal depth.
+
+    python benchmarks/corpus.py [-o benchmarks/corpus.jsonl] [--seed 1]
+
+Every line is ``{"id": ..., "width": ..., "depth": ..., "start": [[...]]}``
+with the standard goal (blank last), so the file can also be fed straight to
+``python -m sliding_puzzle.batch``. 8-puzzle depths are exact BFS distances
+from the goal; 15-puzzle instances come from random walks and are kept when
+an optimal A* solve lands on the wanted depth. The same seed always gives the
+same corpus.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sliding_puzzle import Board, standard_goal
+from sliding_puzzle.informed import PuzzleSolver
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus.jsonl")
+DEPTHS = {
+    3: (4, 8, 12, 16, 20, 24, 28, 31),
+    4: (10, 20, 30, 40),
+}
+PER_DEPTH = {3: 3, 4: 2}
+
+
+def depth_layers(board, goal, blank, max_depth):
+    """ BFS layers ``[[(state, blank), ...], ...]`` around the goal, up to ``max_depth``. """
+    seen = {goal}
+    layers = [[(goal, blank)]]
+    while len(layers) <= max_depth and layers[-1]:
+        layer = []
+        for state, space in layers[-1]:
+            for child, child_blank in board.children(state, space):
+                if child not in seen:
+                    seen.add(child)
+                    layer.append((child, child_blank))
+        layers.append(layer)
+    return layers
+
+
+def eight_puzzle(rng, depths, count):
+    board = Board(3)
+    goal, blank = board.pack(standard_goal(3))
+    layers = depth_layers(board, goal, blank, max(depths))
+    for depth in depths:
+        layer = sorted(layers[depth])
+        for state, _ in rng.sample(layer, min(count, len(layer))):  # Only two states are 31 away
+            yield depth, board.unpack(state)
+
+
+def random_walk(board, rng, state, blank, length):
+    """ Walk ``length`` moves without ever undoing the previous one. """
+    previous = None
+    for _ in range(length):
+        moves = [(child, target) for child, target in board.children(state, blank) if target != previous]
+        previous = blank
+        state, blank = rng.choice(moves)
+    return state
+
+
+def fifteen_puzzle(rng, depths, count):
+    board = Board(4)
+    goal, blank = board.pack(standard_goal(4))
+    for depth in depths:
+        found = 0
+        while found < count:
+            start = board.unpack(random_walk(board, rng, goal, blank, depth + rng.randrange(depth // 2 + 1)))
+            if len(PuzzleSolver(start, "linear_conflict").solve_puzzle()) - 1 == depth:
+                found += 1
+                yield depth, start
+
+
+def build(seed=1):
+    """ Return the corpus records for ``seed``. """
+    rng = random.Random(seed)
+    records = []
+    for width, generate in ((3, eight_puzzle), (4, fifteen_puzzle)):
+        for number, (depth, start) in enumerate(generate(rng, DEPTHS[width], PER_DEPTH[width])):
+            records.append({"id": f"{width}x{width}-d{depth:02}-{number:02}",
+                            "width": width, "depth": depth, "start": start})
+    return records
+
+
+def load(path=CORPUS):
+    with open(path) as stream:
+        return [json.loads(line) for line in stream if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default=CORPUS)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    records = build(args.seed)
+    with open(args.output, "w") as out:
+        for record in records:
+            out.write(json.dumps(record) + "\n")
+    print(f"{len(records)} instances written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare the heap and bucket open lists on the same random instances.
+
+    python benchmarks/frontier.py [--width 3] [--count 30] [--heuristic manhattan]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sliding_puzzle import Board, standard_goal
+from sliding_puzzle.frontier import FRONTIERS
+from sliding_puzzle.informed import PuzzleSolver
+
+
+def random_instances(width, count, walk, seed):
+    """ Start grids reached by random walks from the goal (so always solvable). """
+    rng = random.Random(seed)
+    board = Board(width)
+    goal, goal_blank = board.pack(standard_goal(width))
+    instances = []
+    for _ in range(count):
+        state, blank = goal, goal_blank
+        for _ in range(walk):
+            state, blank = rng.choice(list(board.children(state, blank)))
+        instances.append(board.unpack(state))
+    return instances
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=3)
+    parser.add_argument("--count", type=int, default=30)
+    parser.add_argument("--walk", type=int, default=400, help="random moves per instance")
+    parser.add_argument("--heuristic", default="manhattan")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    instances = random_instances(args.width, args.count, args.walk, args.seed)
+    for method in ("solve_puzzle", "solve_puzzle_best_first_search"):
+        lengths = {}
+        for frontier in sorted(FRONTIERS):
+            began = time.perf_counter()
+            lengths[frontier] = [len(getattr(PuzzleSolver(start, args.heuristic, frontier=frontier), method)())
+                                 for start in instances]
+            elapsed = time.perf_counter() - began
+            print(f"{method:32} {frontier:7} {elapsed:8.3f}s  total path length {sum(lengths[frontier])}")
+        if method == "solve_puzzle" and len(set(map(tuple, lengths.values()))) != 1:
+            print("  optimal lengths differ between frontiers!")
+
+
+if __name__ == "__main__":
+    main()
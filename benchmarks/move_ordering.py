@@ -0,0 +1,89 @@
+"""Count the nodes alpha-beta visits under each move ordering.
+
+    python benchmarks/move_ordering.py [--plies 3]
+
+The fixed position set is every position where the AI (O) is to move with
+at most ``--plies`` marks on the board. Each position is searched once per
+ordering by ``best_move`` from ``Adversarial Search/alphabeta.py``, with a
+fresh transposition table and ordering state, so the node counts do not
+depend on what was searched before. Every ordering must pick the same move
+as board order; the exit status is 1 when one does not.
+"""
+import argparse
+import importlib.util
+import itertools
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from tictactoe.bitboard import CELLS, WINS
+from tictactoe.ordering import MoveOrdering
+from tictactoe.transposition import TranspositionTable
+
+ORDERINGS = {
+    "board order": dict(static=False, hash_move=False, killers=False, history=False),
+    "static": dict(static=True, hash_move=False, killers=False, history=False),
+    "static+hash": dict(static=True, hash_move=True, killers=False, history=False),
+    "static+hash+killers": dict(static=True, hash_move=True, killers=True, history=False),
+    "all": dict(static=True, hash_move=True, killers=True, history=True),
+}
+
+
+def load_alphabeta():
+    path = os.path.join(ROOT, "Adversarial Search", "alphabeta.py")
+    spec = importlib.util.spec_from_file_location("alphabeta", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def positions(plies):
+    """ ``(x, o)`` masks of every unfinished position with O to move and at most ``plies`` marks. """
+    found = []
+    for marks in range(1, plies + 1, 2):
+        for cells in itertools.combinations(range(9), marks):
+            for x_cells in itertools.combinations(cells, marks // 2 + 1):
+                x = sum(CELLS[pos] for pos in x_cells)
+                o = sum(CELLS[pos] for pos in cells) ^ x
+                if not WINS[x] and not WINS[o]:
+                    found.append((x, o))
+    return found
+
+
+def search(alphabeta, options, x, o):
+    """ The cell ``best_move`` picks for the position and the nodes it visited. """
+    alphabeta.table = TranspositionTable()
+    alphabeta.ordering = MoveOrdering(**options)
+    alphabeta.nodes_visited = 0
+    alphabeta.board.x, alphabeta.board.o = x, o
+    alphabeta.best_move()
+    return (alphabeta.board.o ^ o).bit_length() - 1, alphabeta.nodes_visited
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plies", type=int, default=3, help="most marks on a starting position")
+    args = parser.parse_args()
+
+    alphabeta = load_alphabeta()
+    starts = positions(args.plies)
+    reference = None
+    status = 0
+    for name, options in ORDERINGS.items():
+        results = [search(alphabeta, options, x, o) for x, o in starts]
+        nodes = sum(visited for _, visited in results)
+        moves = [move for move, _ in results]
+        if reference is None:
+            reference, baseline = moves, nodes
+        changed = sum(move != expected for move, expected in zip(moves, reference))
+        print(f"{name:20} {nodes:9} nodes  {100 * (1 - nodes / baseline):5.1f}% fewer  "
+              f"over {len(starts)} positions")
+        if changed:
+            print(f"  {changed} moves differ from board order!")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""Run every solver over the benchmark corpus and write one JSON line per run.
+
+    python benchmarks/suite.py -o results.jsonl [--width 3] [--algorithms bfs,astar-manhattan]
+    python benchmarks/suite.py -o new.jsonl --baseline old.jsonl
+
+Each (instance, algorithm) pair runs in its own forked process with a time
+and memory limit, so a search that blows up is recorded as ``timeout`` or
+``memory`` instead of stopping the suite. Records carry wall time, peak RSS
+growth, expansions, generated nodes and solution length, and come out in
+corpus order so two result files can be diffed directly. With ``--baseline``
+the run is compared against an earlier file and the exit status is 1 when
+a solution got longer, a solved run stopped solving, expansions grew or a
+run got slower than ``--slowdown`` times its old time. Needs a Unix
+``fork`` (the ``resource`` module).
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from corpus import CORPUS, load
+from sliding_puzzle import standard_goal
+from sliding_puzzle.informed import PuzzleSolver as InformedSolver
+import Uninformed_Search as uninformed
+
+# name -> (solver family, method, heuristic)
+ALGORITHMS = {
+    "bfs": ("uninformed", "solve_puzzle_bfs", None),
+    "dfs": ("uninformed", "solve_puzzle_dfs", None),
+    "dfid": ("uninformed", "solve_puzzle_dfid", None),
+    "backtracking": ("uninformed", "solve_puzzle_backtracking", None),
+    "greedy-hamming": ("informed", "solve_puzzle_best_first_search", "hamming"),
+    "greedy-manhattan": ("informed", "solve_puzzle_best_first_search", "manhattan"),
+    "astar-hamming": ("informed", "solve_puzzle", "hamming"),
+    "astar-manhattan": ("informed", "solve_puzzle", "manhattan"),
+}
+
+
+def blank_grid(grid):
+    """ The uninformed solver marks the blank with ' ' instead of 0. """
+    return [[uninformed.BLANK if tile == 0 else tile for tile in row] for row in grid]
+
+
+def solve(algorithm, start):
+    """ Run one solver on ``start``; returns ``(path length or None, SearchStats or None)``. """
+    family, method, heuristic = ALGORITHMS[algorithm]
+    width = len(start)
+    if family == "informed":
+        solver = InformedSolver(start, heuristic)
+        path = getattr(solver, method)()
+        return (None if path is None else len(path) - 1), solver.stats
+    solver = uninformed.PuzzleSolver(uninformed.Node(blank_grid(start)),
+                                     uninformed.Node(blank_grid(standard_goal(width))))
+    with contextlib.redirect_stdout(io.StringIO()):
+        node = getattr(solver, method)()
+    length = None
+    while node is not None:
+        length = 0 if length is None else length + 1
+        node = node.parent
+    return length, solver.stats
+
+
+def run_one(conn, algorithm, start, max_memory):
+    """ Child process body: solve, then send the measurements back. """
+    if max_memory:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory << 20, max_memory << 20))
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    record = {}
+    began = time.perf_counter()
+    try:
+        length, stats = solve(algorithm, start)
+    except MemoryError:
+        record["status"] = "memory"
+    except Exception as error:
+        record.update(status="error", error=f"{type(error).__name__}: {error}")
+    else:
+        record["status"] = "solved" if length is not None else "unsolved"
+        record["length"] = length
+        if stats is not None:
+            record["expanded"] = stats.expanded
+            record["generated"] = stats.generated
+            record["peak_frontier"] = stats.peak_frontier
+    record["seconds"] = round(time.perf_counter() - began, 4)
+    # ru_maxrss is in KiB on Linux; the forked child starts from its parent's RSS
+    record["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+    conn.send(record)
+    conn.close()
+
+
+def measure(algorithm, start, timeout, max_memory):
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=run_one, args=(sender, algorithm, start, max_memory))
+    began = time.perf_counter()
+    process.start()
+    sender.close()
+    if receiver.poll(timeout):
+        try:
+            record = receiver.recv()
+        except EOFError:
+            record = {"status": "crashed"}
+    else:
+        record = {"status": "timeout", "seconds": round(time.perf_counter() - began, 4)}
+        process.kill()
+    process.join()
+    receiver.close()
+    return record
+
+
+def run(instances, algorithms, timeout, max_memory, out):
+    for instance in instances:
+        for algorithm in algorithms:
+            record = {"id": instance["id"], "width": instance["width"],
+                      "depth": instance["depth"], "algorithm": algorithm}
+            record.update(measure(algorithm, instance["start"], timeout, max_memory))
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            print(f"{record['id']:12} {algorithm:17} {record['status']:8} "
+                  f"length {record.get('length')!s:5} expanded {record.get('expanded')!s:9} "
+                  f"{record.get('seconds', 0):8.3f}s", file=sys.stderr)
+
+
+def regressions(results, baseline, slowdown):
+    """ Lines describing every run that got worse than in ``baseline``. """
+    old = {(record["id"], record["algorithm"]): record for record in baseline}
+    problems = []
+    for record in results:
+        before = old.get((record["id"], record["algorithm"]))
+        if before is None:
+            continue
+        name = f"{record['id']} {record['algorithm']}"
+        if before["status"] == "solved" and record["status"] != "solved":
+            problems.append(f"{name}: {before['status']} -> {record['status']}")
+            continue
+        if record["status"] != "solved" or before["status"] != "solved":
+            continue
+        if before.get("length") is not None and record["length"] > before["length"]:
+            problems.append(f"{name}: length {before['length']} -> {record['length']}")
+        if before.get("expanded") is not None and record.get("expanded", 0) > before["expanded"]:
+            problems.append(f"{name}: expanded {before['expanded']} -> {record['expanded']}")
+        # Ignore timing noise on runs too short to measure
+        if before.get("seconds", 0) >= 0.05 and record["seconds"] > slowdown * before["seconds"]:
+            problems.append(f"{name}: {before['seconds']}s -> {record['seconds']}s")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", default=CORPUS)
+    parser.add_argument("-o", "--output", help="JSONL results (default: stdout)")
+    parser.add_argument("--algorithms", default=",".join(ALGORITHMS),
+                        help="comma-separated subset of: " + ", ".join(ALGORITHMS))
+    parser.add_argument("--width", type=int, help="only run this puzzle width")
+    parser.add_argument("--max-depth", type=int, help="skip instances deeper than this")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--max-memory", type=int, default=2048, help="MiB per run (0: no limit)")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--slowdown", type=float, default=1.5,
+                        help="time ratio over the baseline reported as a regression")
+    args = parser.parse_args(argv)
+
+    algorithms = args.algorithms.split(",")
+    unknown = [name for name in algorithms if name not in ALGORITHMS]
+    if unknown:
+        parser.error(f"unknown algorithms: {', '.join(unknown)}")
+    instances = [instance for instance in load(args.corpus)
+                 if (args.width is None or instance["width"] == args.width)
+                 and (args.max_depth is None or instance["depth"] <= args.max_depth)]
+
+    results = io.StringIO()
+    run(instances, algorithms, args.timeout, args.max_memory, results)
+    if args.output:
+        with open(args.output, "w") as out:
+            out.write(results.getvalue())
+    else:
+        sys.stdout.write(results.getvalue())
+
+    if args.baseline:
+        records = [json.loads(line) for line in results.getvalue().splitlines()]
+        with open(args.baseline) as stream:
+            baseline = [json.loads(line) for line in stream if line.strip()]
+        problems = regressions(records, baseline, args.slowdown)
+        for problem in problems:
+            print("REGRESSION " + problem, file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
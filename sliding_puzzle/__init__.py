@@ -0,0 +1,5 @@
+"""Shared building blocks for the sliding-puzzle labs."""
+
+from .state import Board, standard_goal
+
+__all__ = ["Board", "standard_goal"]
@@ -0,0 +1,112 @@
+"""ARA*: anytime weighted A* with a shrinking weight.
+
+The first pass is weighted A* on f = g + epsilon * h, which finds a path
+quickly whose cost is at most epsilon times optimal. Each later pass lowers
+epsilon and reuses the previous search: states whose g improved after they
+were expanded are kept on an ``incons`` list and go back on the open list,
+so nothing is searched from scratch. Every pass proves the bound
+``g(goal) / min(g + h)`` over the states still open, which is often far
+tighter than epsilon itself; the search ends when that bound reaches 1
+(the path is optimal), the open list runs out, or the deadline passes.
+
+The bounds need a consistent heuristic: a state closed with too high a g
+is only put back on the open list in the next pass, so within a pass the
+search trusts the g it closed with. Heuristics that do not declare
+``consistent`` (the pattern database, or any ``MaxOf`` containing it) are
+rejected rather than risk reporting a longer path as optimal.
+"""
+import heapq
+import math
+import time
+
+from .node_pool import NodePool
+from .stats import SearchStats
+
+
+def ara_star(board, heuristic, start, blank, goal, epsilon=3.0, decrement=0.5,
+             deadline=None, stats=None):
+    """ Yield ``(packed states, bound)`` each time the solution or its proven
+    suboptimality bound improves. ``deadline`` is a ``time.monotonic()``
+    instant after which the search stops between expansions. """
+    if epsilon < 1:
+        raise ValueError("epsilon must be at least 1")
+    if not getattr(heuristic, "consistent", False):
+        raise ValueError("ARA* needs a consistent heuristic (not a pattern database)")
+    if stats is None:
+        stats = SearchStats("anytime")
+    on_expand, on_generate = stats.on_expand, stats.on_generate
+    clock = time.monotonic
+
+    pool = NodePool(board)
+    root = pool.add(start, -1, 0, heuristic(start), blank)
+    best = {start: root}      # state -> node with its lowest g so far
+    opened = {start}          # states waiting for expansion in this pass
+    incons = set()            # improved after expansion; reopened next pass
+    bound = cost = math.inf
+
+    while True:
+        heap = [(pool.g[best[state]] + epsilon * pool.h[best[state]], pool.h[best[state]], best[state])
+                for state in opened]
+        heapq.heapify(heap)
+        closed = set()
+        # Improve the path until no open node can beat the current solution
+        while heap:
+            f, _, node = heap[0]
+            solution = best.get(goal)
+            if solution is not None and pool.g[solution] <= f:
+                break
+            heapq.heappop(heap)
+            state = pool.states[node]
+            if best[state] != node or state not in opened:
+                continue  # Stale entry
+            if deadline is not None and not stats.expanded % 256 and clock() > deadline:
+                return
+            opened.discard(state)
+            closed.add(state)
+            g = pool.g[node]
+            stats.expanded += 1
+            if on_expand:
+                on_expand(state, g)
+            h = pool.h[node]
+            space = pool.blanks[node]
+            g += 1
+            for target, delta in board.moves[space]:
+                child = state + ((state >> board.shifts[target]) & board.mask) * delta
+                stats.generated += 1
+                if on_generate:
+                    on_generate(child, g)
+                known = best.get(child)
+                if known is not None and g >= pool.g[known]:
+                    continue
+                child_h = heuristic.update(h, child, space, target)
+                child_node = pool.add(child, node, g, child_h, target)
+                best[child] = child_node
+                if child in closed:
+                    incons.add(child)
+                else:
+                    opened.add(child)
+                    heapq.heappush(heap, (g + epsilon * child_h, child_h, child_node))
+            stats.frontier(len(opened))
+        solution = best.get(goal)
+        if solution is None:
+            return  # Start cannot reach the goal
+
+        # Proven bound: no unexpanded state can lead to a path below min(g + h)
+        pending = opened | incons
+        lowest = min((pool.g[best[state]] + pool.h[best[state]] for state in pending), default=math.inf)
+        found = pool.g[solution]
+        if not found:
+            proven = 1.0
+        elif lowest:
+            proven = max(1.0, min(epsilon, found / lowest))
+        else:
+            proven = epsilon
+        if found < cost or proven < bound:
+            cost, bound = found, min(bound, proven)
+            stats.peak_closed = len(best)
+            yield pool.path(solution), bound
+        if bound <= 1 or not pending:
+            return
+        epsilon = max(1.0, epsilon - decrement)
+        opened = pending
+        incons = set()
@@ -0,0 +1,184 @@
+"""Batch solving: stream puzzles in, JSONL results out.
+
+Each input line is one puzzle, either a JSON grid (``[[4, 7, 8], [3, 6, 5],
+[1, 2, 0]]``), a flat JSON list or whitespace-separated tiles (``4 7 8 3 6 5
+1 2 0``), or a JSON object ``{"id": ..., "start": ..., "goal": ...}``::
+
+    python -m sliding_puzzle.batch puzzles.txt -o results.jsonl --heuristic linear_conflict
+
+Lines are read lazily and sent to a process pool in chunks; only a bounded
+number of chunks is in flight at once, so memory stays flat however long the
+input is. Results are written as soon as their chunk finishes, i.e. in
+completion order; the ``line`` field ties each one back to its input.
+"""
+import argparse
+import concurrent.futures
+import itertools
+import json
+import math
+import os
+import sys
+import time
+
+from .frontier import FRONTIERS
+from .heuristics import HEURISTICS
+from .informed import PuzzleSolver
+from .state import Board, standard_goal
+
+ALGORITHMS = {
+    "astar": "solve_puzzle",
+    "greedy": "solve_puzzle_best_first_search",
+    "beam": "solve_puzzle_beam_search",
+    "bidirectional": "solve_puzzle_bidirectional",
+    "lookup": "solve_puzzle_lookup",
+    "sma": "solve_puzzle_memory_bounded",
+}
+
+
+def to_grid(tiles):
+    """ Accept a nested or flat tile list and return a validated square grid. """
+    if tiles and isinstance(tiles[0], list):
+        tiles = [tile for row in tiles for tile in row]
+    width = math.isqrt(len(tiles))
+    if width < 2 or width * width != len(tiles) or sorted(tiles) != list(range(len(tiles))):
+        raise ValueError(f"not a square permutation of 0..N: {tiles}")
+    return [tiles[row * width:(row + 1) * width] for row in range(width)]
+
+
+def parse_puzzle(line):
+    """ Return ``(id, start, goal)``; ``id`` and ``goal`` may be None. """
+    line = line.strip()
+    if line.startswith("{"):
+        record = json.loads(line)
+        start, goal = to_grid(record["start"]), record.get("goal")
+        if goal:
+            goal = to_grid(goal)
+            if len(goal) != len(start):
+                raise ValueError(f"goal is {len(goal)}x{len(goal)} but start is {len(start)}x{len(start)}")
+        return record.get("id"), start, goal
+    if line.startswith("["):
+        return None, to_grid(json.loads(line)), None
+    return None, to_grid([int(tile) for tile in line.replace(",", " ").split()]), None
+
+
+def moved_tiles(path):
+    """ Tiles slid into the blank, in order, along a list of grids. """
+    tiles = []
+    for before, after in zip(path, path[1:]):
+        for row_before, row_after in zip(before, after):
+            for old, new in zip(row_before, row_after):
+                if old and not new:
+                    tiles.append(old)
+    return tiles
+
+
+_worker = {}
+
+
+def init_worker(algorithm, heuristic, width, frontier="heap"):
+    """ Per-process setup: evaluate the heuristic once on the standard goal so its
+    tables (walking-distance BFS, pattern-database and distance-table mappings)
+    are loaded before the first puzzle and then reused for every puzzle. Preloading
+    is only a head start: a table that is missing or built for another goal is
+    reported on each puzzle that needs it instead of stopping the pool. """
+    _worker["method"] = ALGORITHMS[algorithm]
+    _worker["heuristic"] = heuristic
+    _worker["frontier"] = frontier
+    if width:
+        board = Board(width)
+        try:
+            PuzzleSolver(standard_goal(width), heuristic).heuristic(board.pack(standard_goal(width))[0])
+        except (OSError, ValueError):
+            pass
+
+
+def solve_line(number, line):
+    """ Solve one input line; errors become part of the result record. """
+    result = {"line": number}
+    try:
+        puzzle_id, start, goal = parse_puzzle(line)
+        if puzzle_id is not None:
+            result["id"] = puzzle_id
+        began = time.perf_counter()
+        solver = PuzzleSolver(start, _worker["heuristic"], goal, _worker["frontier"])
+        path = getattr(solver, _worker["method"])()
+        result["seconds"] = round(time.perf_counter() - began, 6)
+        if path is None:
+            result["solved"] = False
+            if not solver.solvable:
+                result["error"] = "unsolvable: start and goal have different parity"
+        else:
+            result["solved"] = True
+            result["length"] = len(path) - 1
+            result["moves"] = moved_tiles(path)
+        result["stats"] = solver.stats.as_dict()
+    except (ValueError, KeyError, TypeError, OSError) as error:
+        result["error"] = str(error)  # Includes missing pattern-database or distance-table files
+    return result
+
+
+def solve_chunk(chunk):
+    return [solve_line(number, line) for number, line in chunk]
+
+
+def numbered_lines(stream):
+    for number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield number, line
+
+
+def solve_stream(stream, out, algorithm="astar", heuristic="manhattan", workers=None,
+                 chunksize=64, width=3, frontier="heap"):
+    """ Solve every puzzle in ``stream`` and write one JSON line per puzzle to ``out``.
+    Returns the number of puzzles handled. """
+    workers = workers or os.cpu_count() or 1
+    lines = numbered_lines(stream)
+    handled = 0
+    with concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=init_worker, initargs=(algorithm, heuristic, width, frontier)) as pool:
+        pending = set()
+        while True:
+            # Keep a couple of chunks queued per worker, never the whole input
+            while len(pending) < 2 * workers:
+                chunk = list(itertools.islice(lines, chunksize))
+                if not chunk:
+                    break
+                pending.add(pool.submit(solve_chunk, chunk))
+            if not pending:
+                break
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                for result in future.result():
+                    out.write(json.dumps(result) + "\n")
+                    handled += 1
+            out.flush()
+    return handled
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many sliding puzzles in parallel.")
+    parser.add_argument("input", nargs="?", default="-", help="puzzle file, one per line (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout)")
+    parser.add_argument("--algorithm", choices=sorted(ALGORITHMS), default="astar")
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default="manhattan")
+    parser.add_argument("--frontier", choices=sorted(FRONTIERS), default="heap")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=64, help="puzzles per task")
+    parser.add_argument("--width", type=int, default=3,
+                        help="board width to preload heuristic tables for (0 to skip)")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        solve_stream(source, out, args.algorithm, args.heuristic, args.workers,
+                     args.chunksize, args.width, args.frontier)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
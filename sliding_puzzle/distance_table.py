@@ -0,0 +1,163 @@
+"""Exact distance-to-goal table for the 8-puzzle.
+
+The 3x3 puzzle has only 9! / 2 = 181,440 reachable states, so one
+retrograde BFS from the standard goal gives every state's optimal distance.
+The table is indexed by the Lehmer rank of the full permutation (blank
+included) and stored one byte per rank::
+
+    python -m sliding_puzzle.distance_table build
+
+Solving is then a greedy descent: from any state step to a neighbour whose
+distance is one less, which is an optimal path found without search.
+"""
+import argparse
+import mmap
+import os
+import struct
+from collections import deque
+
+from .heuristics import Heuristic, register_heuristic
+from .pattern_db import DATA_DIR
+from .state import Board, standard_goal
+
+WIDTH = 3
+FILE_NAME = "3x3-distances.bin"
+MAGIC = b"DST1"
+HEADER = struct.calcsize("<4sB") + WIDTH * WIDTH  # magic, width, goal tiles
+UNREACHABLE = 0xFF
+FACTORIALS = (40320, 5040, 720, 120, 24, 6, 2, 1, 1)
+TABLE_SIZE = 362880  # 9!
+
+
+def rank(board, state):
+    """ Lehmer-code index of the 9-cell permutation, 0 .. 9! - 1. """
+    r = 0
+    seen = 0
+    for pos, shift in enumerate(board.shifts):
+        tile = (state >> shift) & board.mask
+        # Later cells holding a smaller tile = tile - earlier cells holding one
+        r += (tile - (seen & ((1 << tile) - 1)).bit_count()) * FACTORIALS[pos]
+        seen |= 1 << tile
+    return r
+
+
+def build(directory=DATA_DIR):
+    """ BFS from the standard goal and write the table; returns its path. """
+    board = Board(WIDTH)
+    goal, blank = board.pack(standard_goal(WIDTH))
+    distances = bytearray([UNREACHABLE]) * TABLE_SIZE
+    distances[rank(board, goal)] = 0
+    queue = deque([(goal, blank)])
+    while queue:
+        state, blank = queue.popleft()
+        distance = distances[rank(board, state)] + 1
+        for child, child_blank in board.children(state, blank):
+            index = rank(board, child)
+            if distances[index] == UNREACHABLE:
+                distances[index] = distance
+                queue.append((child, child_blank))
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, FILE_NAME)
+    with open(path, "wb") as f:
+        f.write(struct.pack("<4sB", MAGIC, WIDTH))
+        f.write(bytes(board.tile_at(goal, pos) for pos in range(board.size)))
+        f.write(distances)
+    return path
+
+
+class DistanceTable:
+    """ Memory-mapped table; the file is opened on first lookup. """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(DATA_DIR, FILE_NAME)
+        self.board = Board(WIDTH)
+        self.goal = self.board.pack(standard_goal(WIDTH))[0]
+        self.data = None
+
+    def load(self):
+        with open(self.path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, width = struct.unpack_from("<4sB", data)
+        goal_tiles = bytes(self.board.tile_at(self.goal, pos) for pos in range(self.board.size))
+        if magic != MAGIC or width != WIDTH or data[HEADER - len(goal_tiles):HEADER] != goal_tiles:
+            raise ValueError(f"{self.path} is not an 8-puzzle distance table")
+        self.data = data
+
+    def distance(self, state):
+        """ Optimal number of moves from ``state`` to the standard goal, or None. """
+        if self.data is None:
+            self.load()
+        distance = self.data[HEADER + rank(self.board, state)]
+        return None if distance == UNREACHABLE else distance
+
+    def relabeling(self, goal):
+        """ Tile renaming that turns ``goal`` into the standard goal. Only goals
+        with the blank in the last cell can be renamed this way. """
+        if self.board.find_blank(goal) != self.board.size - 1:
+            raise ValueError("The distance table only covers goals with the blank in the last cell")
+        mapping = [0] * self.board.size
+        for pos in range(self.board.size - 1):
+            mapping[self.board.tile_at(goal, pos)] = pos + 1
+        return mapping
+
+    def moves(self, state, blank, goal=None):
+        """ Cells the blank visits on an optimal path to ``goal`` (standard by
+        default), or None when the goal cannot be reached. """
+        board = self.board
+        if goal is not None and goal != self.goal:
+            mapping = self.relabeling(goal)
+            state = sum(mapping[board.tile_at(state, pos)] << shift
+                        for pos, shift in enumerate(board.shifts))
+        distance = self.distance(state)
+        if distance is None:
+            return None
+        moves = []
+        while distance:
+            for child, child_blank in board.children(state, blank):
+                if self.distance(child) == distance - 1:
+                    state, blank = child, child_blank
+                    moves.append(blank)
+                    distance -= 1
+                    break
+        return moves
+
+
+_shared = None
+
+
+def shared_table():
+    """ One lazily mapped table per process. """
+    global _shared
+    if _shared is None:
+        _shared = DistanceTable()
+    return _shared
+
+
+class ExactDistance(Heuristic):
+    """ The table itself as a (perfect) heuristic for the standard 3x3 goal. """
+    consistent = True
+
+    def __init__(self, board, goal):
+        table = shared_table()
+        if board.width != WIDTH or goal != table.goal:
+            raise ValueError("The exact heuristic only covers the standard 8-puzzle goal")
+        self.table = table
+
+    def __call__(self, state):
+        return self.table.distance(state)
+
+
+register_heuristic("exact")(ExactDistance)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the 8-puzzle distance table.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_cmd = sub.add_parser("build", help="run the retrograde BFS and write the table")
+    build_cmd.add_argument("--out", default=DATA_DIR, help="output directory")
+    args = parser.parse_args(argv)
+    print(build(args.out))
+
+
+if __name__ == "__main__":
+    main()
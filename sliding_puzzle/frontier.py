@@ -0,0 +1,87 @@
+"""Open-list implementations for the informed solvers.
+
+Both queues take an integer ``priority`` and a secondary ``tie`` key (the
+solvers pass h, so among equal f the deepest node comes out first).
+"""
+import heapq
+
+
+class PriorityQueue:
+    """ Binary heap; O(log n) enqueue and dequeue.
+
+    Every entry is one int, ``priority << 48 | tie << 32 | item``, rather than
+    a tuple: a third of the memory, and ints compare faster. That needs a
+    non-negative priority, a tie below 2**16 (h, which NodePool already
+    stores in 16 bits) and an item below 2**32 (a node-pool index).
+    """
+
+    def __init__(self):
+        self.elements = []
+
+    def enqueue(self, item, priority, tie=0):
+        # Items are node-pool indices, so full ties fall back to insertion order
+        heapq.heappush(self.elements, priority << 48 | tie << 32 | item)
+
+    def dequeue(self):
+        return heapq.heappop(self.elements) & 0xFFFFFFFF
+
+    def is_empty(self):
+        return len(self.elements) == 0
+
+    def __len__(self):
+        return len(self.elements)
+
+
+class BucketQueue:
+    """ Monotone bucket queue for small non-negative integer priorities.
+
+    ``buckets[priority][tie]`` is a LIFO list. Enqueue is O(1); dequeue only
+    walks forward from the lowest non-empty bucket, which is amortised O(1)
+    when priorities never drop far below the last one popped (A* with a
+    consistent heuristic never drops at all).
+    """
+
+    def __init__(self):
+        self.buckets = []
+        self.tie_low = []  # Lowest possibly non-empty tie list per bucket
+        self.low = 0       # Lowest possibly non-empty bucket
+        self.size = 0
+
+    def enqueue(self, item, priority, tie=0):
+        buckets = self.buckets
+        while len(buckets) <= priority:
+            buckets.append([])
+            self.tie_low.append(0)
+        bucket = buckets[priority]
+        while len(bucket) <= tie:
+            bucket.append([])
+        bucket[tie].append(item)
+        if tie < self.tie_low[priority]:
+            self.tie_low[priority] = tie
+        if priority < self.low:
+            self.low = priority
+        self.size += 1
+
+    def dequeue(self):
+        if not self.size:
+            raise IndexError("dequeue from an empty BucketQueue")
+        while True:
+            bucket = self.buckets[self.low]
+            tie = self.tie_low[self.low]
+            while tie < len(bucket) and not bucket[tie]:
+                tie += 1
+            if tie < len(bucket):
+                self.tie_low[self.low] = tie
+                self.size -= 1
+                return bucket[tie].pop()
+            self.tie_low[self.low] = 0
+            self.low += 1
+
+    def is_empty(self):
+        return self.size == 0
+
+    def __len__(self):
+        return self.size
+
+
+FRONTIERS = {"heap": PriorityQueue, "bucket": BucketQueue}
@@ -0,0 +1,315 @@
+"""Informed search (greedy best-first and A*) for N x N sliding puzzles.
+
+One ``PuzzleSolver`` serves every script in ``Informed Search/``; the
+heuristic is picked per solver by name (see ``heuristics.HEURISTICS``), as a
+list of names (their max) or as a factory ``f(board, goal)``. The open list
+is a binary heap by default or a bucket queue with ``frontier="bucket"``.
+After each solve, ``solver.stats`` describes the run (see ``stats.py``).
+"""
+import heapq
+import math
+import time
+
+from . import pattern_db  # noqa: F401  (registers the "pdb" heuristic)
+from .anytime import ara_star
+from .distance_table import WIDTH as TABLE_WIDTH, shared_table
+from .frontier import FRONTIERS
+from .heuristics import get_heuristic
+from .memory_bounded import sma_star
+from .node_pool import NodePool
+from .stats import SearchStats
+from .state import Board, standard_goal
+
+
+class PuzzleSolver:
+    def __init__(self, start, heuristic="manhattan", goal=None, frontier="heap",
+                 profile=False, on_expand=None, on_generate=None):
+        self.start = start
+        self.profile = profile  # Split A*/greedy time into heuristic, generation and queue
+        self.on_expand = on_expand
+        self.on_generate = on_generate
+        self.stats = None  # SearchStats of the last solve
+        if frontier not in FRONTIERS:
+            raise ValueError(f"Unknown frontier {frontier!r}; choose from {sorted(FRONTIERS)}")
+        self.frontier = FRONTIERS[frontier]
+        self.board = Board(len(start))  # Packed-state move tables for this width
+        if goal is not None and (len(goal) != self.board.width
+                                 or any(len(row) != self.board.width for row in goal)):
+            raise ValueError(f"The goal must be {self.board.width}x{self.board.width} like the start")
+        self.goal_state = goal or standard_goal(self.board.width)  # Solved puzzle state
+        self.goal_key = self.board.pack(self.goal_state)[0]
+        # Parity pre-check: unsolvable starts return None before any search
+        self.solvable = self.board.solvable(self.board.pack(start)[0], self.goal_key)
+        self.heuristic_spec = heuristic
+        self.heuristic = get_heuristic(heuristic, self.board, self.goal_key)
+
+    def find_space(self, state):
+        """ Find the cell of the empty space (0); solvers carry it on the Node instead. """
+        return self.board.find_blank(state)
+
+    def find_moves(self, pos):
+        """ Generate the cells the empty space can move to. """
+        return self.board.neighbors[pos]
+
+    def play_move(self, state, move, space):
+        """ Generate a new state after making a move. """
+        return self.board.play(state, space, move)
+
+    def solve_puzzle(self):
+        """ A* Search: expand the node with the lowest f = g + h. """
+        return self.best_first(1, 1, "astar")
+
+    def solve_puzzle_best_first_search(self):
+        """ Best-First (Greedy) Search: expand the node with the lowest h. """
+        return self.best_first(0, 1, "greedy")
+
+    def solve_puzzle_beam_search(self, beam_width=1000):
+        """ Beam Search: greedy search one layer at a time, keeping only the
+        ``beam_width`` children with the lowest h per layer. Memory is
+        O(beam_width * depth), so it still returns a (non-optimal) path on
+        boards too large for a full open list; it can miss a solution when
+        every path to the goal gets pruned. """
+        if beam_width < 1:
+            raise ValueError("beam_width must be at least 1")
+        stats = self.new_stats("beam")
+        if not self.solvable:
+            return stats.finish(None)
+        on_expand, on_generate = self.on_expand, self.on_generate
+        board, update = self.board, self.heuristic.update
+
+        start, blank = board.pack(self.start)
+        pool = NodePool(board)
+        layer = [pool.add(start, -1, 0, self.heuristic(start), blank)]
+        if start == self.goal_key:
+            return stats.finish(self.get_solution_path(pool, layer[0]), 1)
+        kept = {start}  # Every state that made it into a beam
+        g = 0
+        while layer:
+            g += 1
+            candidates = {}  # state -> (h, parent, blank)
+            for node in layer:
+                state = pool.states[node]
+                stats.expanded += 1
+                if on_expand:
+                    on_expand(state, g - 1)
+                space_pos, parent_h = pool.blanks[node], pool.h[node]
+                for move in self.find_moves(space_pos):
+                    new_state = self.play_move(state, move, space_pos)
+                    stats.generated += 1
+                    if on_generate:
+                        on_generate(new_state, g)
+                    if new_state in kept or new_state in candidates:
+                        continue
+                    if new_state == self.goal_key:
+                        goal = pool.add(new_state, node, g, 0, move)
+                        return stats.finish(self.get_solution_path(pool, goal), len(kept))
+                    candidates[new_state] = (update(parent_h, new_state, space_pos, move), node, move)
+            stats.frontier(len(candidates))
+            # Keep the best beam_width by h; ties go to the earlier generated child
+            beam = heapq.nsmallest(beam_width, candidates.items(), key=lambda item: item[1][0])
+            layer = [pool.add(state, parent, g, h, move) for state, (h, parent, move) in beam]
+            kept.update(state for state, _ in beam)
+        return stats.finish(None, len(kept))  # Every branch was pruned or dead-ended
+
+    def solve_puzzle_lookup(self):
+        """ Optimal 8-puzzle path read off the precomputed distance table, no search. """
+        if self.board.width != TABLE_WIDTH:
+            raise ValueError("The distance table only covers the 8-puzzle")
+        stats = self.new_stats("lookup")
+        if not self.solvable:
+            return stats.finish(None)
+        start, blank = self.board.pack(self.start)
+        moves = shared_table().moves(start, blank, self.goal_key)
+        if moves is None:
+            return stats.finish(None)  # No solution found
+        stats.expanded = len(moves)  # One table probe per step
+        return stats.finish([self.board.unpack(state) for state in self.board.replay(start, blank, moves)])
+
+    def solve_puzzle_memory_bounded(self, max_nodes=100000):
+        """ SMA*: A* that never holds more than max_nodes search nodes. Optimal
+        when the optimal path fits in the budget, otherwise the best solution
+        reachable within it (or None). """
+        stats = self.new_stats("sma")
+        if not self.solvable:
+            return stats.finish(None)
+        start, blank = self.board.pack(self.start)
+        path = sma_star(self.board, self.heuristic, start, blank, self.goal_key, max_nodes, stats)
+        if path is None:
+            return stats.finish(None)  # No solution found
+        return stats.finish([self.board.unpack(state) for state in path])
+
+    def solve_puzzle_anytime(self, epsilon=3.0, decrement=0.5, deadline=None):
+        """ Anytime ARA*: yield ``(solution, bound)`` for every improved path,
+        where the path is proven at most ``bound`` times the optimal length.
+        Starts with weight ``epsilon``, lowers it by ``decrement`` per pass and
+        stops once the path is optimal or ``deadline`` seconds have passed.
+        The heuristic must be consistent (ValueError for ``pdb``). """
+        stats = self.new_stats("anytime")
+        if not self.solvable:
+            stats.finish(None)
+            return
+        start, blank = self.board.pack(self.start)
+        until = None if deadline is None else time.monotonic() + deadline
+        path = None
+        for path, bound in ara_star(self.board, self.heuristic, start, blank, self.goal_key,
+                                    epsilon, decrement, until, stats):
+            stats.finish(path)  # Current as of every yielded solution
+            yield [self.board.unpack(state) for state in path], bound
+        stats.finish(path)
+
+    def backward_heuristic(self, start, goal):
+        """ The solver's heuristic aimed at ``start``, for searching back from
+        ``goal``. Tables built for one goal (``pdb``, ``exact``) cannot measure
+        distances to another state, so those fall back to linear conflict. """
+        try:
+            heuristic = get_heuristic(self.heuristic_spec, self.board, start)
+            heuristic(goal)  # Tables are opened, and their goal checked, on first use
+        except ValueError:
+            return get_heuristic("linear_conflict", self.board, start)
+        return heuristic
+
+    def new_stats(self, algorithm):
+        """ Start the SearchStats of a new run. """
+        self.stats = SearchStats(algorithm, self.on_expand, self.on_generate)
+        return self.stats
+
+    def best_first(self, g_weight, h_weight, algorithm):
+        """ Shared frontier loop ordered by g_weight * g + h_weight * h.
+
+        Nodes live in a NodePool and the open list holds their indices.
+        ``open_g`` maps every generated state to its best node; a child is only
+        queued when it beats that node's g, and popped entries that are no
+        longer a state's best node are skipped as stale. """
+        stats = self.new_stats(algorithm)
+        if not self.solvable:
+            return stats.finish(None)
+        board = self.board
+        pq = self.frontier()
+        heuristic, update, play_move = self.heuristic, self.heuristic.update, self.play_move
+        enqueue, dequeue = pq.enqueue, pq.dequeue
+        if self.profile:
+            heuristic = stats.timed(heuristic, "heuristic")
+            update = stats.timed(update, "heuristic")
+            play_move = stats.timed(play_move, "generate")
+            enqueue = stats.timed(enqueue, "queue")
+            dequeue = stats.timed(dequeue, "queue")
+        on_expand, on_generate = self.on_expand, self.on_generate
+
+        start, blank = board.pack(self.start)
+        pool = NodePool(board)
+        h = heuristic(start)
+        root = pool.add(start, -1, 0, h, blank)
+        enqueue(root, h_weight * h, h)
+        open_g = {start: root}
+        # Without g in the priority the first path to a state is as good as any
+        first_path_only = not g_weight
+
+        while not pq.is_empty():
+            current = dequeue()
+            state = pool.states[current]
+            if open_g[state] != current:
+                continue  # Stale duplicate
+            stats.expanded += 1
+            if on_expand:
+                on_expand(state, pool.g[current])
+
+            if state == self.goal_key:
+                return stats.finish(self.get_solution_path(pool, current), len(open_g))
+
+            space_pos = pool.blanks[current]
+            parent_h = pool.h[current]
+            g = pool.g[current] + 1
+            for move in self.find_moves(space_pos):
+                new_state = play_move(state, move, space_pos)
+                stats.generated += 1
+                if on_generate:
+                    on_generate(new_state, g)
+                best = open_g.get(new_state)
+                if best is not None and (first_path_only or g >= pool.g[best]):
+                    continue
+                h = update(parent_h, new_state, space_pos, move)
+                child = pool.add(new_state, current, g, h, move)
+                open_g[new_state] = child
+                enqueue(child, g_weight * g + h_weight * h, h)
+            stats.frontier(len(pq))
+
+        return stats.finish(None, len(open_g))  # No solution found
+
+    def solve_puzzle_bidirectional(self):
+        """ Bidirectional A* (front-to-end): a forward search toward the goal and a
+        backward search toward the start, each with its own heuristic. The side
+        with the smaller open list expands next; the search stops once no open
+        node on either side can beat the best meeting path found so far. """
+        stats = self.new_stats("bidirectional")
+        if not self.solvable:
+            return stats.finish(None)
+        on_expand, on_generate = self.on_expand, self.on_generate
+        board = self.board
+        start, start_blank = board.pack(self.start)
+        goal, goal_blank = board.pack(self.goal_state)
+        heuristics = (self.heuristic, self.backward_heuristic(start, goal))
+        g = ({start: 0}, {goal: 0})
+        parents = ({start: None}, {goal: None})
+        closed = (set(), set())
+        h = (heuristics[0](start), heuristics[1](goal))
+        # Heap entries: (f, g, state, blank, h)
+        open_lists = ([(h[0], 0, start, start_blank, h[0])], [(h[1], 0, goal, goal_blank, h[1])])
+        best, meet = (0, start) if start == goal else (math.inf, None)
+
+        while open_lists[0] and open_lists[1]:
+            if best <= max(open_lists[0][0][0], open_lists[1][0][0]):
+                break
+            side = 0 if len(open_lists[0]) <= len(open_lists[1]) else 1
+            _, cost, state, blank, estimate = heapq.heappop(open_lists[side])
+            if state in closed[side] or cost > g[side][state]:
+                continue  # Stale entry
+            closed[side].add(state)
+            stats.expanded += 1
+            if on_expand:
+                on_expand(state, cost)
+            mine, other = g[side], g[1 - side]
+            for move in self.find_moves(blank):
+                child = self.play_move(state, move, blank)
+                child_g = cost + 1
+                stats.generated += 1
+                if on_generate:
+                    on_generate(child, child_g)
+                if child_g < mine.get(child, math.inf):
+                    mine[child] = child_g
+                    parents[side][child] = state
+                    child_h = heuristics[side].update(estimate, child, blank, move)
+                    heapq.heappush(open_lists[side], (child_g + child_h, child_g, child, move, child_h))
+                    if child in other and child_g + other[child] < best:
+                        best, meet = child_g + other[child], child
+            stats.frontier(len(open_lists[0]) + len(open_lists[1]))
+
+        closed_size = len(g[0]) + len(g[1])
+        if meet is None:
+            return stats.finish(None, closed_size)  # No solution found
+        path = []
+        state = meet
+        while state is not None:
+            path.append(state)
+            state = parents[0][state]
+        path.reverse()
+        state = parents[1][meet]
+        while state is not None:
+            path.append(state)
+            state = parents[1][state]
+        return stats.finish([board.unpack(state) for state in path], closed_size)
+
+    def get_solution_path(self, pool, index):
+        """ Reconstruct the start-to-goal path from a NodePool index. """
+        return [self.board.unpack(state) for state in pool.path(index)]
+
+    def print_solution(self, solution):
+        """ Print the solution path step by step. """
+        if solution:
+            print("\nSolution Path:")
+            for step, state in enumerate(solution, start=1):
+                print(f"Step {step}:")
+                for row in state:
+                    print(" ".join(str(tile) for tile in row))
+                print("\n")
+        else:
+            print("No solution found.")
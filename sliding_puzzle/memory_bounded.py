@@ -0,0 +1,173 @@
+"""SMA*: A* under a fixed node budget.
+
+The search tree is kept explicitly. Before a node is expanded, the worst
+leaves (highest f, shallowest) are dropped until its children fit in
+``max_nodes``. A dropped leaf's f is remembered by its parent, which goes
+back on the open list so the branch can be regenerated if it becomes the
+best option again, and becomes a leaf itself once its last child is gone. Expanding a node backs the
+minimum f of its successors up toward the root, so stored f values only
+ever tighten.
+
+Like SMA*, it returns an optimal solution whenever the optimal path fits in
+the budget. Otherwise it returns the best solution reachable within the
+depth the budget allows, or None when even that does not exist.
+"""
+import heapq
+import itertools
+import math
+
+from .stats import SearchStats
+
+
+class _Node:
+    __slots__ = ("state", "blank", "parent", "g", "h", "f", "depth",
+                 "children", "forgotten", "key", "entry", "in_open", "leaf")
+
+    def __init__(self, state, blank, parent, g, h, f):
+        self.state = state
+        self.blank = blank
+        self.parent = parent
+        self.g = g
+        self.h = h
+        self.f = f                # Backed-up lower bound through this node
+        self.depth = parent.depth + 1 if parent else 0
+        self.children = {}        # state -> _Node currently in memory
+        self.forgotten = {}       # state -> f of pruned successors
+        self.key = f              # Open-list priority
+        self.entry = None         # Sequence number of the live heap entries
+        self.in_open = False
+        self.leaf = None          # Sequence number of the live worst-heap entry
+
+
+def sma_star(board, heuristic, start, blank, goal, max_nodes, stats=None):
+    """ Return the packed states of a solution found within ``max_nodes`` nodes,
+    or None. ``stats`` (a SearchStats) is updated as the search runs. """
+    # A node plus its up-to-four children must fit next to the path above it
+    max_depth = max_nodes - 4
+    if max_depth < 1:
+        raise ValueError("max_nodes must be at least 5")
+    sequence = itertools.count()
+    best_heap = []   # (key, -depth, seq, node): lowest f, deepest first
+    worst_heap = []  # (-key, depth, seq, node): leaves only, highest f, shallowest first
+
+    def push(node):
+        node.entry = next(sequence)
+        node.in_open = True
+        heapq.heappush(best_heap, (node.key, -node.depth, node.entry, node))
+        if not node.children and node.parent is not None:
+            add_leaf(node)
+
+    def add_leaf(node):
+        node.leaf = next(sequence)
+        heapq.heappush(worst_heap, (-node.key, node.depth, node.leaf, node))
+
+    def live(entry):
+        node = entry[3]
+        return node.in_open and node.entry == entry[2]
+
+    def live_leaf(entry):
+        return entry[3].leaf == entry[2]
+
+    def backup(node):
+        while node is not None:
+            values = [child.f for child in node.children.values()]
+            values.extend(node.forgotten.values())
+            new_f = min(values) if values else math.inf
+            if new_f <= node.f:
+                return
+            node.f = new_f
+            node = node.parent
+
+    def prune_worst(expanding):
+        """ Drop the worst leaf that is not a child of ``expanding``; 0 if there is none. """
+        stashed = []
+        try:
+            while worst_heap:
+                entry = heapq.heappop(worst_heap)
+                if not live_leaf(entry):
+                    continue
+                leaf = entry[3]
+                if leaf.parent is expanding:
+                    stashed.append(entry)  # Its siblings are about to be generated
+                    continue
+                leaf.leaf = None
+                leaf.in_open = False
+                parent = leaf.parent
+                del parent.children[leaf.state]
+                parent.forgotten[leaf.state] = leaf.f
+                parent.key = min(parent.forgotten.values())
+                push(parent)
+                return 1
+            return 0
+        finally:
+            for entry in stashed:
+                heapq.heappush(worst_heap, entry)
+
+    if stats is None:
+        stats = SearchStats("sma")
+    on_expand, on_generate = stats.on_expand, stats.on_generate
+    h = heuristic(start)
+    root = _Node(start, blank, None, 0, h, h)
+    push(root)
+    count = 1
+
+    while best_heap:
+        entry = heapq.heappop(best_heap)
+        if not live(entry):
+            continue
+        node = entry[3]
+        if node.key == math.inf:
+            return None  # Nothing left that fits in the budget
+        if node.state == goal:
+            path = []
+            while node is not None:
+                path.append(node.state)
+                node = node.parent
+            return path[::-1]
+
+        node.in_open = False
+        node.leaf = None  # Kept while its children are generated
+        stats.expanded += 1
+        if on_expand:
+            on_expand(node.state, node.g)
+        parent_state = node.parent.state if node.parent else None
+        successors = [(child_state, child_blank)
+                      for child_state, child_blank in board.children(node.state, node.blank)
+                      if child_state != parent_state and child_state not in node.children]
+        # Make room first, so the tree never holds more than max_nodes
+        while count + len(successors) > max_nodes and prune_worst(node):
+            count -= 1
+        for child_state, child_blank in successors:
+            g = node.g + 1
+            child_h = heuristic.update(node.h, child_state, node.blank, child_blank)
+            if child_state != goal and node.depth + 1 > max_depth:
+                f = math.inf  # Too deep to ever hold a full path in memory
+            else:
+                # Pathmax, and never below what a pruned copy had backed up
+                f = max(node.f, g + child_h, node.forgotten.get(child_state, 0))
+            child = _Node(child_state, child_blank, node, g, child_h, f)
+            node.children[child_state] = child
+            push(child)
+            count += 1
+            stats.generated += 1
+            if on_generate:
+                on_generate(child_state, g)
+        stats.frontier(len(best_heap))
+        if count > stats.peak_closed:
+            stats.peak_closed = count  # Nodes held in memory
+        node.forgotten.clear()
+        backup(node)
+        if not node.children and node.parent is not None:
+            node.key = node.f  # Dead end: nothing below it is worth keeping
+            add_leaf(node)
+
+        # Superseded heap entries are dropped lazily; compact before they
+        # outgrow the budget so memory stays proportional to max_nodes
+        if len(best_heap) > 4 * max_nodes:
+            best_heap[:] = [entry for entry in best_heap if live(entry)]
+            heapq.heapify(best_heap)
+        if len(worst_heap) > 4 * max_nodes:
+            worst_heap[:] = [entry for entry in worst_heap if live_leaf(entry)]
+            heapq.heapify(worst_heap)
+
+    return None
@@ -0,0 +1,284 @@
+"""Disjoint additive pattern databases.
+
+A pattern is a group of tiles. Its database stores, for every placement of
+those tiles, the fewest moves *of pattern tiles* needed to bring them home;
+other tiles are indistinguishable and moving them is free. Because the groups
+are disjoint and only their own moves are counted, the per-group values can
+be summed and the total is still admissible.
+
+Tables are built once with a retrograde BFS and written to disk::
+
+    python -m sliding_puzzle.pattern_db build --width 4 --partition 6-6-3
+
+Solvers open them with ``mmap`` the first time the heuristic is evaluated,
+so worker processes share one copy of the pages through the OS page cache
+and nothing is rebuilt or read in full at startup.
+"""
+import argparse
+import mmap
+import os
+import struct
+
+from .heuristics import Heuristic, register_heuristic
+from .state import Board, standard_goal
+
+DATA_DIR = os.environ.get("SLIDING_PUZZLE_DATA_DIR",
+                         os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+
+# Standard partitions of the goal [[1, 2, ...], ..., [..., 0]] by board width.
+# The BFS visits (placement, blank) pairs, so a pattern of k tiles on n cells
+# costs n * n! / (n - k)! pairs: 92 million for six 15-puzzle tiles, but 8.3
+# billion for eight, which is why there is no 7-8 partition.
+PARTITIONS = {
+    3: {
+        "4-4": ((1, 2, 3, 4), (5, 6, 7, 8)),
+    },
+    4: {
+        "6-6-3": ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4)),
+    },
+}
+DEFAULT_PARTITION = {3: "4-4", 4: "6-6-3"}
+
+MAGIC = b"PDB1"
+UNSET = 0xFF
+
+
+def table_size(size, k):
+    """ Number of placements of ``k`` distinct tiles on ``size`` cells. """
+    count = 1
+    for i in range(k):
+        count *= size - i
+    return count
+
+
+def rank(positions, size):
+    """ Index of a placement (cells of the pattern tiles, in pattern order). """
+    r = 0
+    for i, pos in enumerate(positions):
+        smaller = 0
+        for earlier in positions[:i]:
+            if earlier < pos:
+                smaller += 1
+        r = r * (size - i) + pos - smaller
+    return r
+
+
+def unrank(r, k, size):
+    """ Inverse of ``rank``. """
+    digits = []
+    for i in range(k - 1, -1, -1):
+        r, digit = divmod(r, size - i)
+        digits.append(digit)
+    digits.reverse()
+    free = list(range(size))
+    return [free.pop(digit) for digit in digits]
+
+
+def file_name(width, tiles):
+    return f"{width}x{width}-" + "-".join(str(tile) for tile in tiles) + ".pdb"
+
+
+def build_pattern(board, goal, tiles):
+    """ Retrograde 0-1 BFS over (pattern placement, blank cell) pairs.
+
+    Sliding a pattern tile costs 1 and sliding any other tile costs 0. Each
+    cost layer is scanned with ``bytearray.find`` and closed over free moves
+    with a stack, so memory stays at two bytes per pair. Returns one byte per
+    placement: the minimum over blank cells.
+    """
+    n = board.size
+    k = len(tiles)
+    goal_cells = [0] * k
+    for pos in range(n):
+        tile = board.tile_at(goal, pos)
+        if tile in tiles:
+            goal_cells[tiles.index(tile)] = pos
+    goal_blank = board.find_blank(goal)
+    neighbors = board.neighbors
+
+    dist = bytearray([UNSET]) * (table_size(n, k) * n)
+    expanded = bytearray(len(dist))
+    dist[rank(goal_cells, n) * n + goal_blank] = 0
+    layer = 0
+    while True:
+        mark = bytes([layer])
+        found = False
+        scan = dist.find(mark)
+        while scan != -1:
+            found = True
+            stack = [scan]
+            while stack:
+                index = stack.pop()
+                if expanded[index]:
+                    continue
+                expanded[index] = 1
+                r, blank = divmod(index, n)
+                cells = unrank(r, k, n)
+                for target in neighbors[blank]:
+                    if target in cells:
+                        moved = list(cells)
+                        moved[cells.index(target)] = blank
+                        child = rank(moved, n) * n + target
+                        if dist[child] == UNSET:
+                            dist[child] = layer + 1
+                    else:
+                        child = r * n + target
+                        if dist[child] > layer:
+                            dist[child] = layer
+                            stack.append(child)
+            scan = dist.find(mark, scan + 1)
+        if not found:
+            break
+        layer += 1
+    return bytes(min(dist[i:i + n]) for i in range(0, len(dist), n))
+
+
+def pack_nibbles(values):
+    """ Two 4-bit entries per byte (low nibble first). """
+    if len(values) % 2:
+        values += b"\x00"
+    return bytes(values[i] | (values[i + 1] << 4) for i in range(0, len(values), 2))
+
+
+def write_pattern(path, board, goal, tiles, values):
+    """ Write a table with its header: magic, width, bits per entry, pattern size,
+    the goal tiles (one byte per cell) and the pattern tiles. """
+    bits = 4 if max(values) < 16 else 8
+    goal_tiles = bytes(board.tile_at(goal, pos) for pos in range(board.size))
+    with open(path, "wb") as f:
+        f.write(struct.pack("<4sBBB", MAGIC, board.width, bits, len(tiles)))
+        f.write(goal_tiles)
+        f.write(bytes(tiles))
+        f.write(pack_nibbles(values) if bits == 4 else values)
+
+
+def build(width, partition, directory=DATA_DIR, goal=None):
+    """ Build and write every pattern of a named ``partition``; returns the paths. """
+    board = Board(width)
+    if goal is None:
+        goal = default_goal(board)
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for tiles in PARTITIONS[width][partition]:
+        path = os.path.join(directory, file_name(width, tiles))
+        write_pattern(path, board, goal, tiles, build_pattern(board, goal, tiles))
+        paths.append(path)
+    return paths
+
+
+def default_goal(board):
+    """ The packed standard goal: tiles in order, blank in the last cell. """
+    return board.pack(standard_goal(board.width))[0]
+
+
+_mapped = {}
+
+
+def map_file(path):
+    """ Read-only mapping of ``path``, shared by every solver in this process. """
+    path = os.path.abspath(path)
+    if path not in _mapped:
+        with open(path, "rb") as f:
+            _mapped[path] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return _mapped[path]
+
+
+class PatternDatabase(Heuristic):
+    """ Sum of memory-mapped pattern tables; files are opened on first use.
+
+    Admissible but not consistent: each table keeps the minimum over blank
+    cells, so one move can change h by more than 1 (up to 7 on the 8-puzzle). """
+
+    def __init__(self, board, goal, paths):
+        self.board = board
+        self.goal = goal
+        self.paths = paths
+        self.patterns = None
+
+    def load(self):
+        """ Map every table read-only and check it was built for this goal. """
+        goal_tiles = bytes(self.board.tile_at(self.goal, pos) for pos in range(self.board.size))
+        patterns = []
+        for path in self.paths:
+            data = map_file(path)
+            magic, width, bits, k = struct.unpack_from("<4sBBB", data)
+            if magic != MAGIC or width != self.board.width:
+                raise ValueError(f"{path} is not a {self.board.width}x{self.board.width} pattern database")
+            offset = struct.calcsize("<4sBBB")
+            if data[offset:offset + self.board.size] != goal_tiles:
+                raise ValueError(f"{path} was built for a different goal state")
+            offset += self.board.size
+            tiles = tuple(data[offset:offset + k])
+            patterns.append((tiles, bits, data, offset + k))
+        self.patterns = patterns
+        # Which pattern (and slot in it) every tile belongs to
+        self.slot = [None] * self.board.size
+        for group, (tiles, _, _, _) in enumerate(patterns):
+            for i, tile in enumerate(tiles):
+                self.slot[tile] = (group, i)
+
+    def lookup(self, group, cells):
+        tiles, bits, data, offset = self.patterns[group]
+        index = rank(cells, self.board.size)
+        if bits == 8:
+            return data[offset + index]
+        return (data[offset + (index >> 1)] >> ((index & 1) << 2)) & 0xF
+
+    def placements(self, state):
+        """ Cells of every pattern's tiles, one list per pattern. """
+        cells = [[0] * len(tiles) for tiles, _, _, _ in self.patterns]
+        slot = self.slot
+        for pos in range(self.board.size):
+            where = slot[self.board.tile_at(state, pos)]
+            if where:
+                cells[where[0]][where[1]] = pos
+        return cells
+
+    def __call__(self, state):
+        if self.patterns is None:
+            self.load()
+        return sum(self.lookup(group, cells) for group, cells in enumerate(self.placements(state)))
+
+    def update(self, h, child, space, move):
+        # Only the pattern holding the moved tile changes value
+        if self.patterns is None:
+            self.load()
+        where = self.slot[self.board.tile_at(child, space)]
+        if where is None:
+            return h
+        group, i = where
+        cells = self.placements(child)[group]
+        after = self.lookup(group, cells)
+        cells[i] = move
+        return h + after - self.lookup(group, cells)
+
+
+def pattern_database(board, goal, partition=None, directory=None):
+    """ Heuristic over the files of ``partition`` (the default one for the width). """
+    partition = partition or DEFAULT_PARTITION.get(board.width)
+    if partition not in PARTITIONS.get(board.width, {}):
+        raise ValueError(f"No pattern partition {partition!r} for width {board.width}")
+    directory = directory or DATA_DIR
+    paths = [os.path.join(directory, file_name(board.width, tiles))
+             for tiles in PARTITIONS[board.width][partition]]
+    return PatternDatabase(board, goal, paths)
+
+
+register_heuristic("pdb")(pattern_database)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build additive pattern databases.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_cmd = sub.add_parser("build", help="run the retrograde BFS and write the tables")
+    build_cmd.add_argument("--width", type=int, default=4)
+    build_cmd.add_argument("--partition", help="e.g. 4-4 or 6-6-3 (default per width)")
+    build_cmd.add_argument("--out", default=DATA_DIR, help="output directory")
+    args = parser.parse_args(argv)
+    partition = args.partition or DEFAULT_PARTITION[args.width]
+    for path in build(args.width, partition, args.out):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Packed sliding-puzzle states.
+
+A board position is stored as a single int: cell ``pos`` (row-major) holds
+its tile in bits ``[pos * bits, (pos + 1) * bits)`` and the blank is tile 0.
+``bits`` is 4 up to the 15-puzzle and 5 for the 24-puzzle, so a 4x4 state
+fits in 64 bits and a 5x5 one in 125. The int is its own hash key, so
+explored sets need no ``str(state)``, and a move is one shift and add
+instead of a ``copy.deepcopy`` of nested lists. The blank position is
+carried next to the state by the solvers, so nothing has to scan the board
+to find it.
+"""
+
+
+def standard_goal(width):
+    """ Tiles 1..N in reading order with the blank (0) in the last cell. """
+    tiles = list(range(1, width * width)) + [0]
+    return [tiles[row * width:(row + 1) * width] for row in range(width)]
+
+
+class Board:
+    """ Precomputed move tables for a ``width`` x ``width`` sliding puzzle. """
+
+    def __init__(self, width=3):
+        self.width = width
+        self.size = width * width
+        self.bits = max(4, (self.size - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        self.shifts = tuple(pos * self.bits for pos in range(self.size))
+        # neighbors[pos]: cells the blank can slide to from pos (Up, Down, Left, Right)
+        neighbors = []
+        for pos in range(self.size):
+            x, y = divmod(pos, width)
+            cells = []
+            if x > 0: cells.append(pos - width)
+            if x < width - 1: cells.append(pos + width)
+            if y > 0: cells.append(pos - 1)
+            if y < width - 1: cells.append(pos + 1)
+            neighbors.append(tuple(cells))
+        self.neighbors = tuple(neighbors)
+        # moves[blank]: (target, delta) pairs; sliding tile t from target into
+        # the blank turns state into state + t * delta
+        self.moves = tuple(
+            tuple((target, (1 << self.shifts[blank]) - (1 << self.shifts[target]))
+                  for target in self.neighbors[blank])
+            for blank in range(self.size)
+        )
+
+    def pack(self, grid, blank=0):
+        """ Convert a nested list into ``(state, blank_pos)``. """
+        state = 0
+        blank_pos = None
+        pos = 0
+        for row in grid:
+            for tile in row:
+                if tile == blank:
+                    blank_pos = pos
+                else:
+                    state |= tile << self.shifts[pos]
+                pos += 1
+        return state, blank_pos
+
+    def unpack(self, state, blank=0):
+        """ Convert a packed state back into a nested list. """
+        mask = self.mask
+        tiles = [(state >> shift) & mask for shift in self.shifts]
+        w = self.width
+        return [[tile if tile else blank for tile in tiles[row * w:(row + 1) * w]]
+                for row in range(w)]
+
+    def tile_at(self, state, pos):
+        """ Tile stored in cell ``pos`` (0 for the blank). """
+        return (state >> self.shifts[pos]) & self.mask
+
+    def find_blank(self, state):
+        """ Cell of the blank; only needed when it was not carried along. """
+        mask = self.mask
+        for pos, shift in enumerate(self.shifts):
+            if not (state >> shift) & mask:
+                return pos
+
+    def solvable(self, state, goal):
+        """ Whether ``goal`` is reachable from ``state``, for any width and goal.
+
+        A move swaps the blank with a neighbouring cell: one transposition of
+        the cell permutation that also moves the blank one step. So the
+        permutation taking ``state`` to ``goal`` must have the parity of the
+        blank's Manhattan distance between the two. Its parity comes from a
+        cycle count, O(n) rather than counting inversions pairwise. """
+        mask, shifts = self.mask, self.shifts
+        home = [0] * self.size  # home[tile]: cell of tile in goal
+        for pos, shift in enumerate(shifts):
+            home[(goal >> shift) & mask] = pos
+        target = [home[(state >> shift) & mask] for shift in shifts]
+        cycles = 0
+        for pos in range(self.size):
+            if target[pos] >= 0:
+                cycles += 1
+                while target[pos] >= 0:
+                    target[pos], pos = -1, target[pos]
+        start_row, start_col = divmod(self.find_blank(state), self.width)
+        goal_row, goal_col = divmod(home[0], self.width)
+        distance = abs(start_row - goal_row) + abs(start_col - goal_col)
+        return (self.size - cycles) % 2 == distance % 2
+
+    def play(self, state, blank, target):
+        """ Slide the tile at ``target`` into the blank; the blank ends up on ``target``. """
+        return state + ((state >> self.shifts[target]) & self.mask) * (
+            (1 << self.shifts[blank]) - (1 << self.shifts[target]))
+
+    def replay(self, state, blank, moves):
+        """ States visited when the blank is slid onto each cell of ``moves`` in turn. """
+        states = [state]
+        for move in moves:
+            state = self.play(state, blank, move)
+            blank = move
+            states.append(state)
+        return states
+
+    def children(self, state, blank):
+        """ Yield ``(child, child_blank)`` for every legal slide. """
+        shifts = self.shifts
+        mask = self.mask
+        for target, delta in self.moves[blank]:
+            yield state + ((state >> shifts[target]) & mask) * delta, target
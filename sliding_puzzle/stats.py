@@ -0,0 +1,71 @@
+"""Per-run search statistics and profiling hooks.
+
+Every solver call creates a ``SearchStats`` and leaves it on ``solver.stats``.
+Counters are always kept; with ``profile=True`` the A*/greedy loop also
+splits its time between heuristic evaluation, child generation and open-list
+operations. ``on_expand(state, g)`` and ``on_generate(state, g)`` callbacks
+are called with the packed state for every expanded and generated node.
+"""
+import time
+
+
+class SearchStats:
+    def __init__(self, algorithm, on_expand=None, on_generate=None):
+        self.algorithm = algorithm
+        self.on_expand = on_expand
+        self.on_generate = on_generate
+        self.expanded = 0
+        self.generated = 0
+        self.peak_frontier = 0   # Largest open list (or search stack)
+        self.peak_closed = 0     # Largest visited/closed index
+        self.timings = {"heuristic": 0.0, "generate": 0.0, "queue": 0.0}
+        self.elapsed = 0.0
+        self.solution_length = None
+        self.started = time.perf_counter()
+
+    def timed(self, fn, part):
+        """ Wrap ``fn`` so the time spent in it is added to ``timings[part]``. """
+        timings = self.timings
+        clock = time.perf_counter
+
+        def wrapper(*args):
+            began = clock()
+            try:
+                return fn(*args)
+            finally:
+                timings[part] += clock() - began
+        return wrapper
+
+    def frontier(self, size):
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def finish(self, path, closed=0):
+        """ Stop the clock and record the solution; returns ``path`` unchanged. """
+        self.elapsed = time.perf_counter() - self.started
+        self.solution_length = None if path is None else len(path) - 1
+        if closed > self.peak_closed:
+            self.peak_closed = closed
+        return path
+
+    @property
+    def expansions_per_second(self):
+        return self.expanded / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        return {
+            "algorithm": self.algorithm,
+            "expanded": self.expanded,
+            "generated": self.generated,
+            "peak_frontier": self.peak_frontier,
+            "peak_closed": self.peak_closed,
+            "elapsed": self.elapsed,
+            "expansions_per_second": self.expansions_per_second,
+            "timings": dict(self.timings),
+            "solution_length": self.solution_length,
+        }
+
+    def __str__(self):
+        return (f"{self.algorithm}: expanded {self.expanded}, generated {self.generated}, "
+                f"peak frontier {self.peak_frontier}, peak closed {self.peak_closed}, "
+                f"{self.elapsed:.4f}s ({self.expansions_per_second:.0f} expansions/s)")
@@ -0,0 +1,5 @@
+"""Shared building blocks for the adversarial-search (tic-tac-toe) labs."""
+
+from .bitboard import Board
+
+__all__ = ["Board"]
@@ -0,0 +1,72 @@
+"""Bitboard tic-tac-toe.
+
+A position is two 9-bit masks, one per player, where bit ``3 * row + col``
+is that cell. A move is ``mask | bit`` and undoing it is restoring the old
+mask. Every question the search asks about a position is a lookup in a
+512-entry table indexed by one mask:
+
+- ``WINS[mask]``: the mask holds a complete line
+- ``OPEN_LINES[mask]``: lines the *other* player can still complete, i.e.
+  lines with no cell in ``mask``
+- ``TRANSFORMS[k][mask]``: the mask under the k-th of the board's eight
+  symmetries (rotations and reflections)
+"""
+
+EMPTY = ' '
+FULL = 0b111111111
+CELLS = tuple(1 << pos for pos in range(9))
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100,               # diagonals
+)
+WINS = bytes(any(mask & line == line for line in WIN_MASKS) for mask in range(512))
+OPEN_LINES = bytes(sum(not mask & line for line in WIN_MASKS) for mask in range(512))
+
+
+def _symmetries():
+    """ Cell permutations of the 8 dihedral symmetries; ``perm[pos]`` is where ``pos`` goes. """
+    rotate = [(col * 3 + 2 - row) for row in range(3) for col in range(3)]  # 90 degrees clockwise
+    mirror = [(row * 3 + 2 - col) for row in range(3) for col in range(3)]
+    perms = []
+    perm = list(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append([mirror[cell] for cell in perm])
+        perm = [rotate[cell] for cell in perm]
+    return tuple(tuple(perm) for perm in perms)
+
+
+def _transform(perm, mask):
+    return sum(1 << perm[pos] for pos in range(9) if mask >> pos & 1)
+
+
+SYMMETRIES = _symmetries()
+TRANSFORMS = tuple(tuple(_transform(perm, mask) for mask in range(512)) for perm in SYMMETRIES)
+
+
+class Board:
+    """ Both players' masks; ``x`` for the human (X), ``o`` for the AI (O). """
+    __slots__ = ("x", "o")
+
+    def __init__(self, x=0, o=0):
+        self.x = x
+        self.o = o
+
+    def mask(self, player):
+        return self.x if player == 'X' else self.o
+
+    def cell(self, pos):
+        """ 'X', 'O' or ' ' for cell ``pos`` (0-8). """
+        bit = CELLS[pos]
+        return 'X' if self.x & bit else 'O' if self.o & bit else EMPTY
+
+    def place(self, pos, player):
+        if player == 'X':
+            self.x |= CELLS[pos]
+        else:
+            self.o |= CELLS[pos]
+
+    def rows(self):
+        """ The position as a 3x3 list of 'X' / 'O' / ' ' strings. """
+        return [[self.cell(row * 3 + col) for col in range(3)] for row in range(3)]
@@ -0,0 +1,132 @@
+"""Perfect-play opening book for 3x3 tic-tac-toe.
+
+Only 5,478 positions can be reached from the empty board, so all of them
+are solved once, offline, with the scoring ``Adversarial Search/minmax.py``
+uses (a win is worth 10, and every move adds the heuristic of the position
+it leads to). The result is one ``(move, score)`` pair per position,
+stored in a table indexed by the board read as a base-3 number (cell
+``pos`` is digit ``pos``: 0 empty, 1 X, 2 O)::
+
+    python -m tictactoe.book build
+
+``move`` is the cell the side to move should take, chosen exactly as the
+live search chooses it (the first best cell in board order), so looking a
+position up gives the same game as searching it. Positions that cannot be
+reached, and finished ones, have no move.
+"""
+import argparse
+import os
+import struct
+from array import array
+
+from .bitboard import CELLS, FULL, OPEN_LINES, WINS
+
+DATA_DIR = os.environ.get("TICTACTOE_DATA_DIR",
+                          os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+FILE_NAME = "3x3-book.bin"
+MAGIC = b"TTB1"
+NO_MOVE = 0xFF
+TABLE_SIZE = 3 ** 9
+HEADER = struct.calcsize("<4sH")  # magic, table size
+
+# Base-3 value of a mask with digit 1 on each of its cells
+DIGITS = tuple(sum(3 ** pos for pos in range(9) if mask >> pos & 1) for mask in range(512))
+
+
+def index(x, o):
+    """ Table slot of the position, 0 .. 3**9 - 1. """
+    return DIGITS[x] + 2 * DIGITS[o]
+
+
+def solve():
+    """ ``{(x, o): (move, score)}`` for every position reachable from the empty board. """
+    solved = {}
+
+    def value(x, o):
+        if (x, o) in solved:
+            return solved[x, o][1]
+        taken = x | o
+        if WINS[x]:
+            score, move = -10, NO_MOVE
+        elif WINS[o]:
+            score, move = 10, NO_MOVE
+        elif taken == FULL:
+            score, move = 0, NO_MOVE
+        else:
+            # X moves first, so O is to move whenever X has more marks
+            o_to_move = x.bit_count() > o.bit_count()
+            score = best = move = None
+            for pos, bit in enumerate(CELLS):
+                if taken & bit:
+                    continue
+                child_x, child_o = (x, o | bit) if o_to_move else (x | bit, o)
+                child = value(child_x, child_o)
+                child_score = child + OPEN_LINES[child_x] - OPEN_LINES[child_o]
+                if score is None or (child_score > score if o_to_move else child_score < score):
+                    score = child_score
+                # The game loop ranks its own moves by the child's value alone
+                if best is None or (child > best if o_to_move else child < best):
+                    best, move = child, pos
+        solved[x, o] = (move, score)
+        return score
+
+    value(0, 0)
+    return solved
+
+
+def build(directory=DATA_DIR):
+    """ Solve every reachable position and write the book; returns its path. """
+    moves = bytearray([NO_MOVE]) * TABLE_SIZE
+    scores = array("b", bytes(TABLE_SIZE))
+    for (x, o), (move, score) in solve().items():
+        slot = index(x, o)
+        moves[slot] = move
+        scores[slot] = score
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, FILE_NAME)
+    with open(path, "wb") as f:
+        f.write(struct.pack("<4sH", MAGIC, TABLE_SIZE))
+        f.write(moves)
+        f.write(scores.tobytes())
+    return path
+
+
+class OpeningBook:
+    """ The whole table held in memory (about 40 KB). """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(DATA_DIR, FILE_NAME)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        magic, size = struct.unpack_from("<4sH", data)
+        if magic != MAGIC or size != TABLE_SIZE or len(data) != HEADER + 2 * TABLE_SIZE:
+            raise ValueError(f"{self.path} is not a tic-tac-toe opening book")
+        self.moves = data[HEADER:HEADER + TABLE_SIZE]
+        self.scores = array("b", data[HEADER + TABLE_SIZE:])
+
+    def lookup(self, x, o):
+        """ ``(move, score)`` for the side to move, or None when the book has no move. """
+        slot = index(x, o)
+        move = self.moves[slot]
+        return None if move == NO_MOVE else (move, self.scores[slot])
+
+
+def load_book(path=None):
+    """ The book, or None when it has not been built yet. """
+    try:
+        return OpeningBook(path)
+    except FileNotFoundError:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the tic-tac-toe opening book.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_cmd = sub.add_parser("build", help="solve every reachable position and write the book")
+    build_cmd.add_argument("--out", default=DATA_DIR, help="output directory")
+    args = parser.parse_args(argv)
+    print(build(args.out))
+
+
+if __name__ == "__main__":
+    main()
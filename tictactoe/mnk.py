@@ -0,0 +1,184 @@
+"""m,n,k-games: tic-tac-toe on any board size with any win length.
+
+``MNKBoard(rows, cols, k)`` keeps the same two-mask layout as the 3x3
+bitboard (bit ``row * cols + col``, one arbitrary-size int per player) but
+builds its tables from the parameters: every run of ``k`` cells in a row,
+column or diagonal is a line mask, and each cell knows the lines through
+it. That makes both win detection and the heuristic incremental: a move can
+only complete a line through its own cell, and it only closes the
+opponent's still-open lines through that cell.
+
+Boards like 15x15 with k=5 are far too large to search to the end, so
+``Search`` runs depth-limited alpha-beta with the open-line heuristic at the
+horizon, deepening one ply at a time until the per-move time budget runs
+out, and plays the best move of the deepest finished iteration. On large
+boards only cells next to a mark are tried (``reach``).
+"""
+import math
+import time
+
+WIN = 1000000  # Above any heuristic value; a win found at ply d scores WIN - d
+
+
+class MNKBoard:
+    """ Both players' masks; ``x`` for the human (X), ``o`` for the AI (O). """
+
+    def __init__(self, rows=3, cols=3, k=3, reach=None):
+        if not 1 <= k <= max(rows, cols):
+            raise ValueError("The win length must fit on the board")
+        self.rows, self.cols, self.k = rows, cols, k
+        self.size = rows * cols
+        self.full = (1 << self.size) - 1
+        self.lines = self._lines()
+        self.lines_through = tuple(tuple(line for line in self.lines if line >> pos & 1)
+                                   for pos in range(self.size))
+        # Cells on more lines first: for 3x3 that is center, corners, edges
+        self.order = tuple(sorted(range(self.size), key=lambda pos: -len(self.lines_through[pos])))
+        if reach is None:
+            reach = 1 if self.size > 49 else max(rows, cols)
+        self.near = tuple(self._neighbourhood(pos, reach) for pos in range(self.size))
+        self.x = self.o = 0
+        self.nearby = 0  # Cells within ``reach`` of a mark
+        # Lines each player can still complete, i.e. lines without an opponent mark
+        self.open_x = self.open_o = len(self.lines)
+
+    def _lines(self):
+        lines = []
+        for row in range(self.rows):
+            for col in range(self.cols):
+                for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_row, end_col = row + d_row * (self.k - 1), col + d_col * (self.k - 1)
+                    if 0 <= end_row < self.rows and 0 <= end_col < self.cols:
+                        lines.append(sum(1 << ((row + d_row * i) * self.cols + col + d_col * i)
+                                         for i in range(self.k)))
+        return tuple(lines)
+
+    def _neighbourhood(self, pos, reach):
+        row, col = divmod(pos, self.cols)
+        return sum(1 << (r * self.cols + c)
+                   for r in range(max(0, row - reach), min(self.rows, row + reach + 1))
+                   for c in range(max(0, col - reach), min(self.cols, col + reach + 1)))
+
+    def mask(self, player):
+        return self.x if player == 'X' else self.o
+
+    def cell(self, pos):
+        """ 'X', 'O' or ' ' for cell ``pos`` (0 .. rows * cols - 1). """
+        return 'X' if self.x >> pos & 1 else 'O' if self.o >> pos & 1 else ' '
+
+    def rows_of_cells(self):
+        """ The position as a list of rows of 'X' / 'O' / ' ' strings. """
+        return [[self.cell(row * self.cols + col) for col in range(self.cols)] for row in range(self.rows)]
+
+    def is_full(self):
+        return self.x | self.o == self.full
+
+    def place(self, pos, player):
+        """ Put ``player``'s mark on ``pos``; returns True when that move wins. """
+        bit = 1 << pos
+        if player == 'X':
+            # Lines through pos that O could still complete are now closed
+            self.open_o -= sum(not self.x & line for line in self.lines_through[pos])
+            self.x |= bit
+            mask = self.x
+        else:
+            self.open_x -= sum(not self.o & line for line in self.lines_through[pos])
+            self.o |= bit
+            mask = self.o
+        self.nearby |= self.near[pos]
+        return any(mask & line == line for line in self.lines_through[pos])
+
+    def count_winning_lines(self, player):
+        """ Lines ``player`` can still complete. """
+        return self.open_x if player == 'X' else self.open_o
+
+    def heuristic(self):
+        """ E(n) = M(n) - O(n), with the AI (O) as the max player. """
+        return self.open_o - self.open_x
+
+    def candidates(self):
+        """ Empty cells worth trying, in search order. """
+        taken = self.x | self.o
+        if not taken:
+            return [self.order[0]]
+        free = self.nearby & ~taken
+        return [pos for pos in self.order if free >> pos & 1]
+
+
+class _TimeUp(Exception):
+    """ The move's time budget ran out in the middle of an iteration. """
+
+
+class Search:
+    """ Iterative-deepening alpha-beta on an ``MNKBoard``, one move at a time. """
+
+    def __init__(self, board, budget=1.0, max_depth=None):
+        self.board = board
+        self.budget = budget
+        self.max_depth = max_depth
+        self.nodes_visited = 0
+        self.depth_reached = 0
+        self.deadline = math.inf
+
+    def best_move(self, player='O'):
+        """ Cell for ``player`` from the deepest iteration finished within the budget. """
+        board = self.board
+        self.deadline = time.monotonic() + self.budget
+        maximizing = player == 'O'
+        moves = board.candidates()
+        move = moves[0]
+        empty = board.size - (board.x | board.o).bit_count()
+        limit = empty if self.max_depth is None else min(empty, self.max_depth)
+        self.depth_reached = 0
+        for depth in range(1, limit + 1):
+            try:
+                scores = {pos: self.root_score(pos, player, depth) for pos in moves}
+            except _TimeUp:
+                break
+            # The best move so far leads the next, deeper iteration
+            moves.sort(key=scores.get, reverse=maximizing)
+            move = moves[0]
+            self.depth_reached = depth
+            if abs(scores[move]) >= WIN - depth:
+                break  # A forced result does not change with more depth
+        return move
+
+    def root_score(self, pos, player, depth):
+        board = self.board
+        state = (board.x, board.o, board.nearby, board.open_x, board.open_o)
+        try:
+            if board.place(pos, player):
+                return WIN - 1 if player == 'O' else 1 - WIN
+            return self.minimax(1, depth, player == 'X', -math.inf, math.inf)
+        finally:
+            board.x, board.o, board.nearby, board.open_x, board.open_o = state
+
+    def minimax(self, ply, depth, is_maximizing, alpha, beta):
+        """ Alpha-beta to ``depth`` plies from the root, scored from O's side. """
+        self.nodes_visited += 1
+        if not self.nodes_visited & 1023 and time.monotonic() > self.deadline:
+            raise _TimeUp
+        board = self.board
+        if board.is_full():
+            return 0
+        if ply == depth:
+            return board.heuristic()
+
+        state = (board.x, board.o, board.nearby, board.open_x, board.open_o)
+        player = 'O' if is_maximizing else 'X'
+        best = -math.inf if is_maximizing else math.inf
+        for pos in board.candidates():
+            if board.place(pos, player):
+                score = WIN - ply - 1 if is_maximizing else ply + 1 - WIN
+            else:
+                score = self.minimax(ply + 1, depth, not is_maximizing, alpha, beta)
+            board.x, board.o, board.nearby, board.open_x, board.open_o = state
+            if is_maximizing:
+                best = max(best, score)
+                alpha = max(alpha, score)
+            else:
+                best = min(best, score)
+                beta = min(beta, score)
+            if beta <= alpha:
+                break
+        return best
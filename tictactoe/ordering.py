@@ -0,0 +1,65 @@
+"""Move ordering for alpha-beta search.
+
+Alpha-beta prunes the most when the best move at a node is searched first.
+``MoveOrdering`` builds the order from four sources, each of which can be
+switched off:
+
+- ``static``: center, then corners, then edges (cells on more lines first)
+  instead of board order
+- ``hash_move``: the best move the transposition table remembers for the
+  position is searched before anything else
+- ``killers``: the last two moves that caused a cutoff at the same ply
+- ``history``: moves are ranked by how often, and how deep, they caused
+  cutoffs anywhere in the tree for the same player
+
+With everything off the order is plain board order. Ordering only changes how
+much is pruned: every search still returns the same values.
+"""
+from .bitboard import CELLS
+
+BOARD_ORDER = tuple(range(9))
+STATIC_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+KILLERS_PER_PLY = 2
+
+
+class MoveOrdering:
+    def __init__(self, static=True, hash_move=True, killers=True, history=True):
+        self.order = STATIC_ORDER if static else BOARD_ORDER
+        self.use_hash_move = hash_move
+        self.use_killers = killers
+        self.use_history = history
+        self.killers = [[] for _ in range(9)]   # ply -> cells, most recent first
+        self.history = ([0] * 9, [0] * 9)       # player (0: X, 1: O) -> score per cell
+
+    def new_search(self):
+        """ Forget the killers and age the history before the next move's search. """
+        for killers in self.killers:
+            killers.clear()
+        for scores in self.history:
+            scores[:] = [score >> 1 for score in scores]
+
+    def moves(self, taken, depth, maximizing, hash_move=None):
+        """ Free cells of the position in the order to search them. """
+        moves = [pos for pos in self.order if not taken & CELLS[pos]]
+        if self.use_history:
+            scores = self.history[maximizing]
+            moves.sort(key=lambda pos: -scores[pos])  # Stable: ties keep the base order
+        first = []
+        if self.use_hash_move and hash_move is not None:
+            first.append(hash_move)
+        if self.use_killers:
+            first += [pos for pos in self.killers[depth] if not taken & CELLS[pos] and pos not in first]
+        if not first:
+            return moves
+        return first + [pos for pos in moves if pos not in first]
+
+    def cutoff(self, pos, depth, maximizing, draft):
+        """ Record that ``pos`` refuted the node at ``depth`` with ``draft`` plies below it. """
+        if self.use_killers:
+            killers = self.killers[depth]
+            if pos in killers:
+                killers.remove(pos)
+            killers.insert(0, pos)
+            del killers[KILLERS_PER_PLY:]
+        if self.use_history:
+            self.history[maximizing][pos] += draft * draft
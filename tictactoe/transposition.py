@@ -0,0 +1,75 @@
+"""Transposition table keyed on symmetry-reduced positions.
+
+The same position is reached through many move orders, and in up to eight
+orientations. ``canonical(x, o)`` maps all of them to one key: the smallest
+18-bit ``x << 9 | o`` over the board's symmetries, so every rotation and
+reflection shares one entry.
+
+Entries are ``(flag, value, move)``, where ``flag`` tells alpha-beta whether
+``value`` is exact or only a lower or upper bound, and ``move`` is the best
+cell found, in the canonical orientation (``to_canonical`` and
+``from_canonical`` convert it). The table is a fixed
+number of slots addressed by a hash of the key. A new entry replaces the one
+in its slot when that one comes from an earlier search or covers a subtree
+no deeper than the new one (depth-preferred replacement).
+"""
+from .bitboard import SYMMETRIES, TRANSFORMS
+
+EXACT, LOWER, UPPER = 0, 1, 2
+UNDO = tuple(tuple(perm.index(pos) for pos in range(9)) for perm in SYMMETRIES)
+
+
+def canonical(x, o):
+    """ Symmetry-reduced key of the position. """
+    return min((transform[x] << 9) | transform[o] for transform in TRANSFORMS)
+
+
+def canonical_symmetry(x, o):
+    """ ``(key, k)``: the canonical key and a symmetry ``k`` that maps the position onto it. """
+    return min(((transform[x] << 9) | transform[o], k) for k, transform in enumerate(TRANSFORMS))
+
+
+def to_canonical(pos, k):
+    """ Cell ``pos`` of a position as a cell of its canonical form. """
+    return SYMMETRIES[k][pos]
+
+
+def from_canonical(pos, k):
+    """ Cell ``pos`` of the canonical form as a cell of the position. """
+    return UNDO[k][pos]
+
+
+class TranspositionTable:
+    def __init__(self, bits=12):
+        self.shift = 64 - bits
+        self.slots = [None] * (1 << bits)  # (key, generation, draft, flag, value, move)
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def new_search(self):
+        """ Mark existing entries as old, so the next search may overwrite them. """
+        self.generation += 1
+
+    def _index(self, key):
+        # Fibonacci hashing spreads the mostly-low-bit keys over the slots
+        return ((key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> self.shift
+
+    def probe(self, key):
+        """ ``(flag, value, move)`` stored for ``key``, or None. """
+        slot = self.slots[self._index(key)]
+        if slot is not None and slot[0] == key:
+            self.hits += 1
+            return slot[3:]
+        self.misses += 1
+        return None
+
+    def store(self, key, draft, flag, value, move=None):
+        """ Record a result; ``draft`` is how many plies deep the search below went. """
+        index = self._index(key)
+        slot = self.slots[index]
+        if slot is None or slot[0] == key or slot[1] != self.generation or draft >= slot[2]:
+            self.slots[index] = (key, self.generation, draft, flag, value, move)
+
+    def __len__(self):
+        return sum(slot is not None for slot in self.slots)